@@ -1,72 +1,208 @@
 import json
+import os
+import numpy as np
 import pandas as pd
 from collections import defaultdict
-from sklearn.metrics import precision_recall_fscore_support
+from concurrent.futures import ThreadPoolExecutor
+
+# ijson streams the top-level blocks one at a time, so the whole nested
+# dump never sits in memory next to the records list; fall back to a
+# full json.load when it isn't installed.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson decodes large nested JSON several times faster than stdlib;
+# used for the non-streaming path when ijson isn't available.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # === CONFIG ===
 json_path = "detailed_results_v5_updated.json"
 
+
 # === LOAD JSON ===
-with open(json_path, "r") as f:
-    data = json.load(f)
+def iter_result_blocks(path):
+    """Yield (key, block) pairs from the top-level JSON object."""
+    if ijson is not None:
+        with open(path, "rb") as f:
+            yield from ijson.kvitems(f, "")
+    elif orjson is not None:
+        with open(path, "rb") as f:
+            yield from orjson.loads(f.read()).items()
+    else:
+        with open(path, "r") as f:
+            yield from json.load(f).items()
+
 
 # === COLLECT ALL SAMPLES ===
-records = []
+# The flattened samples are cached as Parquet next to the JSON so repeat
+# analysis runs skip the parse entirely while the source is unchanged.
+cache_path = json_path + ".parquet"
+df = None
+try:
+    if os.path.getmtime(cache_path) >= os.path.getmtime(json_path):
+        df = pd.read_parquet(cache_path)
+        print(f"Loaded {len(df)} samples from cache {cache_path}")
+except OSError:
+    pass  # no cache yet (or no source): parse the JSON below
+
+if df is None:
+    # Column-wise accumulation: one list per field instead of a dict per
+    # row, so the DataFrame below is built from a dict of ready-made
+    # columns with no row-by-row re-columnization.
+    violations, strategies, models, languages = [], [], [], []
+    ids, preds = [], []
 
-for full_key, model_block in data.items():
+    for full_key, model_block in iter_result_blocks(json_path):
+        try:
+            # Parse key: e.g. "lsp--model--strategy"
+            expected_violation, model_name, strategy = full_key.split("--")
+            strategy_data = model_block[strategy]
+            items = strategy_data["violation_results"][expected_violation]["items"]
+        except Exception as e:
+            print(f"Skipping malformed block: {full_key} — {e}")
+            continue
+
+        if not items:
+            continue
+
+        violation = expected_violation.upper()
+        # Hot loop: bind the append methods (and item.get per item) to
+        # locals so each field costs one call, not an attribute chain
+        app_v, app_s, app_m = violations.append, strategies.append, models.append
+        app_l, app_i, app_p = languages.append, ids.append, preds.append
+        for item in items:
+            get = item.get
+            app_v(violation)
+            app_s(strategy)
+            app_m(get("model", model_name))
+            app_l(get("language", "UNKNOWN").upper())
+            app_i(item["id"])
+            app_p(bool(get("violation_match", False)))
+
+    # Key columns go in as Categorical from the start: no object-dtype
+    # string columns are ever materialized, and every later comparison
+    # or reduction works on dictionary codes
+    df = pd.DataFrame({
+        "violation": pd.Categorical(violations),
+        "strategy": pd.Categorical(strategies),
+        "model": pd.Categorical(models),
+        "language": pd.Categorical(languages),
+        "id": ids,
+        "label": True,  # All gold labels are True (we expect violation to be matched)
+        "pred": preds,
+    })
     try:
-        # Parse key: e.g. "lsp--model--strategy"
-        expected_violation, model_name, strategy = full_key.split("--")
-        strategy_data = model_block[strategy]
-        items = strategy_data["violation_results"][expected_violation]["items"]
-    except Exception as e:
-        print(f"Skipping malformed block: {full_key} — {e}")
-        continue
-
-    for item in items:
-        records.append({
-            "violation": expected_violation.upper(),
-            "strategy": strategy,
-            "model": item.get("model", model_name),
-            "language": item.get("language", "UNKNOWN").upper(),
-            "id": item["id"],
-            "label": True,  # All gold labels are True (we expect violation to be matched)
-            "pred": bool(item.get("violation_match", False))
-        })
-
-df = pd.DataFrame(records)
+        df.to_parquet(cache_path)
+    except Exception:
+        pass  # no parquet engine installed or read-only directory
+
+# Idempotent for the parse path (already Categorical); normalizes the
+# cache path in case the Parquet engine returned plain strings.
+for c in ("violation", "strategy", "model", "language"):
+    df[c] = df[c].astype("category")
 
 # === METRIC FUNCTION ===
-def compute_metrics(group, keys):
-    y_true = group["label"]
-    y_pred = group["pred"]
-    precision, recall, f1, _ = precision_recall_fscore_support(
-        y_true, y_pred, average="binary", zero_division=0
-    )
-    return {
-        **{k: group[k].iloc[0] for k in keys},
-        "accuracy": round((y_true == y_pred).mean(), 3),
-        "precision": round(precision, 3),
-        "recall": round(recall, 3),
-        "f1_score": round(f1, 3),
-        "support": len(group)
-    }
+# The gold label is constant True, so the confusion flags collapse to
+# the pred mask: tp == pred, fn == ~pred, fp is identically zero and
+# accuracy equals recall. The masks come straight off the parsed column
+# and the frame never carries per-row flag columns.
+_pred_mask = df["pred"].to_numpy(dtype=bool)
+FLAG_MASKS = {
+    "tp": _pred_mask,
+    "fp": np.zeros(len(df), dtype=bool),
+    "fn": ~_pred_mask,
+    "correct": _pred_mask,
+}
 
-# === GROUP AND CALCULATE ===
-results_vio_strat = df.groupby(["violation", "strategy"]).apply(lambda g: compute_metrics(g, ["violation", "strategy"]))
-results_vio_strat_lang = df.groupby(["violation", "strategy", "language"]).apply(lambda g: compute_metrics(g, ["violation", "strategy", "language"]))
-results_vio_strat_model = df.groupby(["violation", "strategy", "model"]).apply(lambda g: compute_metrics(g, ["violation", "strategy", "model"]))
+# Category codes/labels resolved once; the three tables below reuse
+# these arrays instead of re-extracting them per call.
+KEY_CODES = {c: df[c].cat.codes.to_numpy() for c in ("violation", "strategy", "model", "language")}
+KEY_CATS = {c: df[c].cat.categories for c in ("violation", "strategy", "model", "language")}
+
+
+def metrics_frame(df, keys):
+    # Fuse the categorical key codes into one composite code per row and
+    # reduce with np.bincount: every group's confusion counts fall out of
+    # a single O(N) pass, with no hash-partition or per-group slicing.
+    key_info = [(k, KEY_CATS[k], len(KEY_CATS[k])) for k in keys]
+    code = np.zeros(len(df), dtype=np.int64)
+    n = 1
+    for k, _, size in key_info:
+        code = code * size + KEY_CODES[k]
+        n *= size
+    # The flags are 0/1, so counting the codes where each flag is set
+    # beats weighted bincounts: integer counting loops, no float
+    # accumulation, and the results come back as ints
+    support = np.bincount(code, minlength=n)
+    tp = np.bincount(code[FLAG_MASKS["tp"]], minlength=n)
+    fp = np.bincount(code[FLAG_MASKS["fp"]], minlength=n)
+    fn = np.bincount(code[FLAG_MASKS["fn"]], minlength=n)
+    correct = np.bincount(code[FLAG_MASKS["correct"]], minlength=n)
+
+    # Keep only observed groups — the categorical cartesian product is
+    # never materialized (the observed=True concern for categorical
+    # groupbys) — and no row-level sort happens anywhere: composite-code
+    # order already matches the sorted lexicographic order the groupby
+    # version produced
+    occupied = np.flatnonzero(support)
+    support, tp, fp, fn, correct = (a[occupied] for a in (support, tp, fp, fn, correct))
+
+    # Decode composite codes back into one label column per key
+    cols = {}
+    rem = occupied
+    for k, cats, size in reversed(key_info):
+        cols[k] = cats.to_numpy().take(rem % size)
+        rem = rem // size
+    out = pd.DataFrame({k: cols[k] for k in keys})
 
-# === OUTPUT AS DATAFRAMES ===
-df_vio_strat = pd.DataFrame(results_vio_strat.tolist())
-df_vio_strat_lang = pd.DataFrame(results_vio_strat_lang.tolist())
-df_vio_strat_model = pd.DataFrame(results_vio_strat_model.tolist())
+    precision = np.where(tp + fp > 0, tp / np.maximum(tp + fp, 1), 0.0)
+    recall = np.where(tp + fn > 0, tp / np.maximum(tp + fn, 1), 0.0)
+    f1 = np.where(precision + recall > 0,
+                  2 * precision * recall / np.maximum(precision + recall, 1e-12), 0.0)
+    out["accuracy"] = (correct / support).round(3)
+    out["precision"] = precision.round(3)
+    out["recall"] = recall.round(3)
+    out["f1_score"] = f1.round(3)
+    out["support"] = support
+    return out
+
+# === GROUP AND CALCULATE ===
+# The three tables are independent reductions over read-only arrays, and
+# bincount releases the GIL, so worker threads overlap them on multicore
+with ThreadPoolExecutor(max_workers=3) as pool:
+    fut_strat = pool.submit(metrics_frame, df, ["violation", "strategy"])
+    fut_lang = pool.submit(metrics_frame, df, ["violation", "strategy", "language"])
+    fut_model = pool.submit(metrics_frame, df, ["violation", "strategy", "model"])
+df_vio_strat = fut_strat.result()
+df_vio_strat_lang = fut_lang.result()
+df_vio_strat_model = fut_model.result()
 
 # Save to CSV
 df_vio_strat.to_csv("metrics_by_strategy.csv", index=False)
 df_vio_strat_lang.to_csv("metrics_by_language.csv", index=False)
 df_vio_strat_model.to_csv("metrics_by_model.csv", index=False)
 
+# Overall match rate is one vectorized reduction over the match mask —
+# no walk over the flattened samples
+overall_matches = int(FLAG_MASKS["tp"].sum())
+if len(df):
+    print(f"\n📊 Overall match rate: {overall_matches}/{len(df)} = {overall_matches / len(df):.3f}")
+
+# Per-strategy match rate straight from the precomputed codes and masks:
+# two bincounts for all strategies, no per-strategy re-filtering of df
+strategy_totals = np.bincount(KEY_CODES["strategy"], minlength=len(KEY_CATS["strategy"]))
+strategy_matches = np.bincount(KEY_CODES["strategy"][FLAG_MASKS["tp"]],
+                               minlength=len(KEY_CATS["strategy"]))
+print("\n📊 Match rate by strategy:")
+for name, matches, total in zip(KEY_CATS["strategy"], strategy_matches, strategy_totals):
+    if total:
+        print(f"  {name:12s}: {matches}/{total} = {matches / total:.3f}")
+
 # Print summary and tell the user where to find results
 print("\n✅ Metrics saved:")
 print("- metrics_by_strategy.csv")
@@ -1,9 +1,15 @@
+import csv
 import json
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from collections import defaultdict
+from itertools import product
+
+# Shared across the sweep helpers so the lists aren't re-allocated per call
+VIOLATIONS = ['srp', 'ocp', 'lsp', 'isp', 'dip']
+MODELS = ['deepseek33b-temp0-latest', 'qwen2.5-coder32b-temp0-latest', 'gpt-4o-mini', 'codellama70b-temp0-latest']
+STRATEGIES = ['smell', 'example', 'default', 'ensemble']
 
 def debug_json_structure(json_file_path):
     """
@@ -255,51 +261,50 @@ def calculate_accuracy_matrix(results):
     
     return np.array(accuracy_matrix), violation_labels, difficulty_levels
 
+def f1_matrix_from_counts(tp, fp, fn):
+    """
+    Compute an F1 matrix (in percent) from per-cell TP/FP/FN count arrays
+    in one vectorized pass instead of per-cell Python arithmetic
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+        recall = np.where(tp + fn > 0, tp / (tp + fn), 0.0)
+        f1 = np.where(precision + recall > 0,
+                      2 * (precision * recall) / (precision + recall), 0.0)
+    return f1 * 100
+
 def calculate_f1_by_strategy(f1_results):
     """
     Calculate F1 scores averaged by strategy across all models
     """
     solid_principles = ['SRP', 'OCP', 'LSP', 'ISP', 'DIP']
     strategies = ['smell', 'example', 'default', 'ensemble']
-    
-    # Aggregate results by strategy
-    strategy_aggregated = defaultdict(lambda: defaultdict(lambda: {'tp': 0, 'fp': 0, 'fn': 0}))
-    
+
+    # Stage 1: accumulate TP/FP/FN counts into (violation, strategy) arrays
+    violation_labels = [v for v in solid_principles
+                        if any('_' in k for k in f1_results.get(v, {}))]
+    violation_index = {v: i for i, v in enumerate(violation_labels)}
+    strategy_index = {s: j for j, s in enumerate(strategies)}
+
+    tp = np.zeros((len(violation_labels), len(strategies)))
+    fp = np.zeros((len(violation_labels), len(strategies)))
+    fn = np.zeros((len(violation_labels), len(strategies)))
+
     for violation in f1_results:
-        for strategy_model_key in f1_results[violation]:
+        if violation not in violation_index:
+            continue
+        i = violation_index[violation]
+        for strategy_model_key, counts in f1_results[violation].items():
             if '_' in strategy_model_key:
                 strategy = strategy_model_key.split('_')[0]
-                tp = f1_results[violation][strategy_model_key]['tp']
-                fp = f1_results[violation][strategy_model_key]['fp']
-                fn = f1_results[violation][strategy_model_key]['fn']
-                
-                strategy_aggregated[violation][strategy]['tp'] += tp
-                strategy_aggregated[violation][strategy]['fp'] += fp
-                strategy_aggregated[violation][strategy]['fn'] += fn
-    
-    # Calculate F1 matrix
-    f1_matrix = []
-    violation_labels = []
-    
-    for violation in solid_principles:
-        if violation in strategy_aggregated:
-            row = []
-            for strategy in strategies:
-                if strategy in strategy_aggregated[violation]:
-                    tp = strategy_aggregated[violation][strategy]['tp']
-                    fp = strategy_aggregated[violation][strategy]['fp']
-                    fn = strategy_aggregated[violation][strategy]['fn']
-                    
-                    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-                    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-                    f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-                    row.append(f1_score * 100)
-                else:
-                    row.append(0)
-            f1_matrix.append(row)
-            violation_labels.append(violation)
-    
-    return np.array(f1_matrix), violation_labels, strategies
+                j = strategy_index.get(strategy)
+                if j is not None:
+                    tp[i, j] += counts['tp']
+                    fp[i, j] += counts['fp']
+                    fn[i, j] += counts['fn']
+
+    # Stage 2: vectorized F1 over the count arrays
+    return f1_matrix_from_counts(tp, fp, fn), violation_labels, strategies
 
 def calculate_f1_by_model(f1_results):
     """
@@ -315,51 +320,34 @@ def calculate_f1_by_model(f1_results):
         'codellama70b-temp0-latest': 'CodeLlama-70B'
     }
     
-    # Aggregate results by model
-    model_aggregated = defaultdict(lambda: defaultdict(lambda: {'tp': 0, 'fp': 0, 'fn': 0}))
-    
-    for violation in f1_results:
-        for strategy_model_key in f1_results[violation]:
-            if '_' in strategy_model_key:
-                parts = strategy_model_key.split('_', 1)
-                if len(parts) > 1:
-                    model = parts[1]
-                    clean_model = model_mapping.get(model, model)
-                    
-                    tp = f1_results[violation][strategy_model_key]['tp']
-                    fp = f1_results[violation][strategy_model_key]['fp']
-                    fn = f1_results[violation][strategy_model_key]['fn']
-                    
-                    model_aggregated[violation][clean_model]['tp'] += tp
-                    model_aggregated[violation][clean_model]['fp'] += fp
-                    model_aggregated[violation][clean_model]['fn'] += fn
-    
     # Get clean model names in order
     clean_models = list(model_mapping.values())
-    
-    # Calculate F1 matrix
-    f1_matrix = []
-    violation_labels = []
-    
-    for violation in solid_principles:
-        if violation in model_aggregated:
-            row = []
-            for model in clean_models:
-                if model in model_aggregated[violation]:
-                    tp = model_aggregated[violation][model]['tp']
-                    fp = model_aggregated[violation][model]['fp']
-                    fn = model_aggregated[violation][model]['fn']
-                    
-                    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
-                    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
-                    f1_score = 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0
-                    row.append(f1_score * 100)
-                else:
-                    row.append(0)
-            f1_matrix.append(row)
-            violation_labels.append(violation)
-    
-    return np.array(f1_matrix), violation_labels, clean_models
+
+    # Stage 1: accumulate TP/FP/FN counts into (violation, model) arrays
+    violation_labels = [v for v in solid_principles
+                        if any('_' in k for k in f1_results.get(v, {}))]
+    violation_index = {v: i for i, v in enumerate(violation_labels)}
+    model_index = {m: j for j, m in enumerate(clean_models)}
+
+    tp = np.zeros((len(violation_labels), len(clean_models)))
+    fp = np.zeros((len(violation_labels), len(clean_models)))
+    fn = np.zeros((len(violation_labels), len(clean_models)))
+
+    for violation in f1_results:
+        if violation not in violation_index:
+            continue
+        i = violation_index[violation]
+        for strategy_model_key, counts in f1_results[violation].items():
+            if '_' in strategy_model_key:
+                model = strategy_model_key.split('_', 1)[1]
+                j = model_index.get(model_mapping.get(model, model))
+                if j is not None:
+                    tp[i, j] += counts['tp']
+                    fp[i, j] += counts['fp']
+                    fn[i, j] += counts['fn']
+
+    # Stage 2: vectorized F1 over the count arrays
+    return f1_matrix_from_counts(tp, fp, fn), violation_labels, clean_models
 
 def calculate_language_matrix(language_results):
     """
@@ -599,6 +587,17 @@ def create_combined_accuracy_heatmap(accuracy_matrix, language_matrix,
     
     plt.show()
 
+def save_matrix_csv(path, matrix, row_labels, col_labels):
+    """
+    Write a small labeled matrix directly with csv.writer; building a
+    DataFrame just to call to_csv costs more than the write itself
+    """
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([''] + list(col_labels))
+        for label, row in zip(row_labels, matrix):
+            writer.writerow([label, *np.asarray(row).tolist()])
+
 def generate_detailed_report(results):
     """
     Generate a detailed text report of the results
@@ -647,15 +646,10 @@ def main():
                                            figsize=(16, 6))
             
             # Save individual CSVs
-            df_accuracy = pd.DataFrame(accuracy_matrix, 
-                                     index=violation_labels, 
-                                     columns=difficulty_levels)
-            df_accuracy.to_csv("solid_violations_accuracy_by_level.csv")
-            
-            df_language = pd.DataFrame(lang_matrix, 
-                                     index=principles, 
-                                     columns=language_labels)
-            df_language.to_csv("solid_violations_accuracy_by_language.csv")
+            save_matrix_csv("solid_violations_accuracy_by_level.csv",
+                            accuracy_matrix, violation_labels, difficulty_levels)
+            save_matrix_csv("solid_violations_accuracy_by_language.csv",
+                            lang_matrix, principles, language_labels)
             print("Combined accuracy results saved to 'solid_violations_accuracy_combined.png'")
             print("Individual CSV files saved for difficulty and language accuracy")
         else:
@@ -692,15 +686,10 @@ def main():
                                      figsize=(16, 6))
             
             # Save individual CSVs
-            df_f1_model = pd.DataFrame(f1_model_matrix, 
-                                     index=f1_violation_labels_model, 
-                                     columns=models)
-            df_f1_model.to_csv("solid_violations_f1_by_model.csv")
-            
-            df_f1_strategy = pd.DataFrame(f1_strategy_matrix, 
-                                        index=f1_violation_labels, 
-                                        columns=strategies)
-            df_f1_strategy.to_csv("solid_violations_f1_by_strategy.csv")
+            save_matrix_csv("solid_violations_f1_by_model.csv",
+                            f1_model_matrix, f1_violation_labels_model, models)
+            save_matrix_csv("solid_violations_f1_by_strategy.csv",
+                            f1_strategy_matrix, f1_violation_labels, strategies)
             print("Combined F1 results saved to 'solid_violations_f1_combined.png'")
             print("Individual CSV files saved for model and strategy F1 scores")
         
@@ -726,44 +715,36 @@ def process_custom_json_key(json_data, violation, model_clean, strategy):
     Process data using custom JSON key format for all violations
     """
     json_key = f"{violation.lower()}--{model_clean}--{strategy}"
-    
-    if json_key in json_data:
-        model_data = json_data[json_key]
-        print(f"Processing key: {json_key}")
-        
-        # Extract violation results
-        if isinstance(model_data, dict):
-            # Look for nested structure with violation name
-            if violation.lower() in model_data:
-                nested_data = model_data[violation.lower()]
-                if 'violation_results' in nested_data:
-                    return nested_data['violation_results']
-            elif 'violation_results' in model_data:
-                return model_data['violation_results']
-        
-        return model_data
-    else:
+
+    model_data = json_data.get(json_key)
+    if model_data is None:
         print(f"Key '{json_key}' not found in data")
         return None
 
+    print(f"Processing key: {json_key}")
+
+    # Extract violation results via get-chains instead of repeated key hashing
+    if isinstance(model_data, dict):
+        # Look for nested structure with violation name
+        nested_data = model_data.get(violation.lower())
+        if nested_data is not None:
+            results = nested_data.get('violation_results')
+            if results is not None:
+                return results
+        else:
+            results = model_data.get('violation_results')
+            if results is not None:
+                return results
+
+    return model_data
+
 def process_all_violations(json_data):
     """
     Process all SOLID violations across all models and strategies
     """
-    violations = ['srp', 'ocp', 'lsp', 'isp', 'dip']
-    models = ['deepseek33b-temp0-latest', 'qwen2.5-coder32b-temp0-latest', 'gpt-4o-mini', 'codellama70b-temp0-latest']
-    strategies = ['smell', 'example', 'default', 'ensemble']
-    
-    all_results = {}
-    
-    for violation in violations:
-        for model in models:
-            for strategy in strategies:
-                json_key = f"{violation}--{model}--{strategy}"
-                if json_key in json_data:
-                    all_results[json_key] = json_data[json_key]
-    
-    return all_results
+    keys = (f"{violation}--{model}--{strategy}"
+            for violation, model, strategy in product(VIOLATIONS, MODELS, STRATEGIES))
+    return {key: json_data[key] for key in keys if key in json_data}
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
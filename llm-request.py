@@ -1,19 +1,51 @@
+import argparse
+import hashlib
 import json
 import os
-import subprocess
 import re
 import time
-
-OLLAMA_PATH = "ollama"
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import diskcache
+import requests
+from tqdm import tqdm
+from requests.adapters import HTTPAdapter
+
+# orjson serializes the large prompt/raw_response strings much faster than
+# stdlib json; fall back to stdlib when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+OLLAMA_URL = "http://localhost:11434/api/generate"
+
+# One keep-alive session shared by all worker threads: a single connection
+# pool instead of a fork/exec + pipe setup per prompt.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Persistent response cache so crashed/repeated runs don't redo LLM calls
+CACHE = diskcache.Cache(".ollama_cache")
 OLLAMA_MODELS = ["codellama70b-temp0:latest", "deepseek33b-temp0:latest", "qwen2.5-coder32b-temp0:latest"]
 # OLLAMA_MODEL = "qwen2.5-coder32b-temp0:latest"
-DATA_PATHs = ["data/srp_violations.json", "data/ocp_violations.json", "data/lsp_violations.json", "data/isp_violations.json", "data/dip_violations.json"]
-
-def ensemble_prompt(code_snippet, language="Java"):
-    return f"""Analyze the following {language} code for SOLID principle violations:
+# Violation name paired explicitly with its file instead of being parsed
+# back out of the filename on every iteration
+DATASET_FILES = [
+    ("srp", "data/srp_violations.json"),
+    ("ocp", "data/ocp_violations.json"),
+    ("lsp", "data/lsp_violations.json"),
+    ("isp", "data/isp_violations.json"),
+    ("dip", "data/dip_violations.json"),
+]
+
+def ensemble_prompt_parts(language="Java"):
+    head = f"""Analyze the following {language} code for SOLID principle violations:
 
 ```{language.lower()}
-{code_snippet}
+"""
+    tail = """
 ```
 
 INSTRUCTIONS:
@@ -40,30 +72,31 @@ REMEMBER:
 - If there is NO violation, write **NONE** and provide no explanation.
 - If there IS a violation, provide an explanation of what makes it a violation.
 """
-
-def code_smell_prompt(code_snippet, language): 
-   return ( 
-       f"First, identify any code smells (e.g., God Object, Interface Bloat, Inappropriate Intimacy) in the following {language} code.\n" 
-       "Then, map each smell to a relevant SOLID principle.\n" 
-       "After that, rate the code from 0 (bad) to 5 (good) on:\n" 
-       "SRP, OCP, LSP, ISP, DIP.\n\n" 
+    return head, tail
+
+def code_smell_prompt_parts(language):
+   head = (
+       f"First, identify any code smells (e.g., God Object, Interface Bloat, Inappropriate Intimacy) in the following {language} code.\n"
+       "Then, map each smell to a relevant SOLID principle.\n"
+       "After that, rate the code from 0 (bad) to 5 (good) on:\n"
+       "SRP, OCP, LSP, ISP, DIP.\n\n"
        "Then, pick the **single most violated** principle and explain the violation.\n\n"
-       "If there is no violation, you can return NONE.\n" 
-       "**Important:** Your output must follow *exactly* this format, with no additional commentary before or after.\n\n" 
-       "**<VIOLATION TYPE>**\n" 
-       "<Explanation of the violation>\n\n" 
-       "Only output the text above. Do not include extra analysis or preamble.\n\n" 
-       "Example:\n" 
-       "**SRP**\n" 
+       "If there is no violation, you can return NONE.\n"
+       "**Important:** Your output must follow *exactly* this format, with no additional commentary before or after.\n\n"
+       "**<VIOLATION TYPE>**\n"
+       "<Explanation of the violation>\n\n"
+       "Only output the text above. Do not include extra analysis or preamble.\n\n"
+       "Example:\n"
+       "**SRP**\n"
        "This class violates the Single Responsibility Principle because it has multiple responsibilities.\n\n"
-       + code_snippet 
    )
+   return head, ""
 
-def default_prompt(source, language):
-   return f"Identify the type of SOLID violation (Single Responsibility Principle, Open-Closed Principle, Liskov Substitution Principle, Interface Segregation Principle) in the following {language} code. If you cannot find a violation, return NONE:\n{source}"
+def default_prompt_parts(language):
+   return f"Identify the type of SOLID violation (Single Responsibility Principle, Open-Closed Principle, Liskov Substitution Principle, Interface Segregation Principle) in the following {language} code. If you cannot find a violation, return NONE:\n", ""
 
-def example_prompt(source, language):
-    return (
+def example_prompt_parts(language):
+    head = (
         f"You are an expert in identifying and refactoring SOLID principle violations in {language} code. "
         "Your task is to analyze the code provided and respond in the exact format below, without any additional text or commentary.\n\n"
         "You must provide the following three parts in your response:\n"
@@ -81,10 +114,10 @@ def example_prompt(source, language):
         "<Explanation of the violation>\n\n"
         "Example output:\n"
         "**SRP**\n"
-        "This class violates the Single Responsibility Principle because it has multiple responsibilities.\n\n" 
+        "This class violates the Single Responsibility Principle because it has multiple responsibilities.\n\n"
         "Here is the code:\n"
-        + source
     )
+    return head, ""
 
 def extract_code_block(response):
     matches = re.findall(r"```(?:\w+)?\n(.*?)```", response, re.DOTALL)
@@ -94,133 +127,221 @@ def extract_explanation(response):
     parts = response.split("```")
     return parts[0].strip() if parts else ""
 
+# Compiled once at import so the hot extraction path skips the per-call
+# regex-cache lookup on this long alternation.
+_VIOLATION_RE = re.compile(
+    r"\b(SRP|SINGLE RESPONSIBILITY PRINCIPLE|OCP|OPEN-CLOSED PRINCIPLE|LSP|LISKOV SUBSTITUTION PRINCIPLE|ISP|INTERFACE SEGREGATION PRINCIPLE|DIP|DEPENDENCY INVERSION PRINCIPLE)\b",
+    re.IGNORECASE
+)
+
+# Every alternative in _VIOLATION_RE is determined by its first letter
+# (S/O/L/I/D), so canonicalizing only needs this 5-entry table instead of
+# upper-casing and hashing the full match text.
+_VIOLATION_BY_FIRST_CHAR = {'S': 'SRP', 'O': 'OCP', 'L': 'LSP', 'I': 'ISP', 'D': 'DIP'}
+
 def extract_violation(response, return_list=False):
-    pattern = r"(?i)\b(SRP|SINGLE RESPONSIBILITY PRINCIPLE|OCP|OPEN-CLOSED PRINCIPLE|LSP|LISKOV SUBSTITUTION PRINCIPLE|ISP|INTERFACE SEGREGATION PRINCIPLE|DIP|DEPENDENCY INVERSION PRINCIPLE)\b"
-    matches = re.findall(pattern, response)
+    matches = _VIOLATION_RE.findall(response)
 
     if not matches:
         return [] if return_list else "Unknown"
 
-    mapping = {
-        "SINGLE RESPONSIBILITY PRINCIPLE": "SRP",
-        "SRP": "SRP",
-        "OPEN-CLOSED PRINCIPLE": "OCP",
-        "OCP": "OCP",
-        "LISKOV SUBSTITUTION PRINCIPLE": "LSP",
-        "LSP": "LSP",
-        "INTERFACE SEGREGATION PRINCIPLE": "ISP",
-        "ISP": "ISP",
-        "DEPENDENCY INVERSION PRINCIPLE": "DIP",
-        "DIP": "DIP",
-    }
-
-    unique = list(dict.fromkeys(mapping[m.upper()] for m in matches))
+    unique = list(dict.fromkeys(_VIOLATION_BY_FIRST_CHAR[m[0].upper()] for m in matches))
     return unique if return_list else ", ".join(unique)
 
+# Keep the current model resident in VRAM for the whole sweep; reloading
+# multi-GB weights between strategy/dataset switches costs 10s+ per call.
+KEEP_ALIVE = "30m"
+
+def warmup_model(model_name):
+    """Load the model into the server once so swaps aren't paid per example."""
+    try:
+        SESSION.post(OLLAMA_URL, json={"model": model_name, "prompt": "", "keep_alive": KEEP_ALIVE}, timeout=600)
+    except requests.RequestException as e:
+        print(f"[ERROR] Warmup failed for {model_name}:", e)
+
+
+def unload_model(model_name):
+    """Evict the model so the next one in the sweep gets a clean VRAM state."""
+    try:
+        SESSION.post(OLLAMA_URL, json={"model": model_name, "prompt": "", "keep_alive": 0}, timeout=600)
+    except requests.RequestException as e:
+        print(f"[ERROR] Unload failed for {model_name}:", e)
+
+
 def run_ollama(prompt, model_name):
+    cache_key = hashlib.blake2b((model_name + "\0" + prompt).encode(), digest_size=16).hexdigest()
+    hit = CACHE.get(cache_key)
+    if hit is not None:
+        return hit
+
     try:
-        cmd = [OLLAMA_PATH, "run", model_name]
-
-        process = subprocess.Popen(
-            cmd,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True  # text=True
+        response = SESSION.post(
+            OLLAMA_URL,
+            json={
+                "model": model_name,
+                "prompt": prompt,
+                "stream": False,
+                "keep_alive": KEEP_ALIVE,
+                "options": {"temperature": 0}
+            },
+            timeout=600
         )
 
-        stdout, stderr = process.communicate(input=prompt, timeout=600)
-
-        if process.returncode != 0:
-            print(f"[ERROR] Ollama failed for {model_name}:", stderr.strip())
+        if response.status_code != 200:
+            print(f"[ERROR] Ollama failed for {model_name}:", response.text.strip())
             return "[ERROR: Ollama failed]"
 
-        return stdout.strip()
+        result = response.json()["response"].strip()
+        CACHE.set(cache_key, result)  # only successful responses are cached
+        return result
 
-    except subprocess.TimeoutExpired:
+    except requests.Timeout:
         return "[ERROR: Ollama timed out]"
-def engineer_prompt(source, language):
-    return (
+def engineer_prompt_parts(language):
+    head = (
         f"Identify violations in the following {language} code that has a solid violation. "
         f"The type of violation will be given to you at the end of the prompt. "
         f"*Important:* Your output must follow exactly this format, with no additional commentary before or after.\n\n"
         f"*<VIOLATION TYPE>*\n"
         f"<Explanation of the violation>\n\n"
         f"Only output the text above. Do not include extra analysis or preamble.\n\n"
-        f"{source}"
-    )        
+    )
+    return head, ""
+
+def load_completed_ids(output_path):
+    """Collect example ids already written to a previous run's JSONL output."""
+    if not os.path.exists(output_path):
+        return set()
+
+    completed = set()
+    with open(output_path, "r") as f:
+        for line in f:
+            try:
+                completed.add(json.loads(line)["id"])
+            except (json.JSONDecodeError, KeyError):
+                continue
+    return completed
+
+def dump_jsonl_entry(entry):
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + "\n").encode()
 
 def sanitize_model_name(model):
     return model.replace(":", "-").replace("/", "-")
 
-def build_prompt(strategy, code, language):
+@lru_cache(maxsize=None)
+def prompt_parts(strategy, language):
+    """Render the invariant (head, tail) of a template once per (strategy, language)."""
     if strategy == "example":
-        return example_prompt(code, language)
+        return example_prompt_parts(language)
     elif strategy == "ensemble":
-        return ensemble_prompt(code, language)
+        return ensemble_prompt_parts(language)
     elif strategy == "smell":
-        return code_smell_prompt(code, language)
+        return code_smell_prompt_parts(language)
     elif strategy == "default":
-        return default_prompt(code, language)
+        return default_prompt_parts(language)
     elif strategy == "no":
-        return engineer_prompt(code, language)
+        return engineer_prompt_parts(language)
     else:
         raise ValueError(f"Unknown strategy: {strategy}")
 
+def build_prompt(strategy, code, language):
+    head, tail = prompt_parts(strategy, language)
+    return head + code + tail
+
+
+def process_example(idx, example, prompt, strategy, violation_name, model_name):
+    start_time = time.time()
+
+    language = example.get("language", "Java")
+
+    final_response = run_ollama(prompt, model_name)
+    explanation = extract_explanation(final_response)
+    code_block = "NO FIX VERSION"  # Placeholder for code block extraction
+
+    # Single regex pass; the display string is derived from the list
+    violation_list = extract_violation(final_response, return_list=True)
+
+    duration = time.time() - start_time
+
+    return {
+        "id": idx,
+        "strategy": strategy,
+        "violation_type": violation_name,
+        "model": model_name,
+        "language": language,
+        "input": example["input"],
+        "prompt": prompt,
+        "raw_response": final_response,
+        "violation": ", ".join(violation_list) if violation_list else "Unknown",
+        "violation_list": violation_list,
+        "explanation": explanation,
+        "solution_code": code_block,
+        "duration_seconds": duration
+    }
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Run SOLID violation prompts against Ollama models")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Number of concurrent Ollama requests (match to GPU capacity)")
+    args = parser.parse_args()
+
     strategies = ["ensemble", "example", "smell", "default"]
+
+    # Load every dataset once up front; they were previously re-read and
+    # re-parsed for each model in the outer loop.
+    datasets = {}
+    for violation_name, data_path in DATASET_FILES:
+        with open(data_path, "r") as f:
+            data_json = json.load(f)
+        datasets[data_path] = data_json.get("code_examples", data_json)
+
+    # Prompts only depend on (strategy, example), so build them once and
+    # reuse them across models.
+    prompts = {
+        (data_path, strategy): [
+            build_prompt(strategy, example["input"], example.get("language", "Java"))
+            for example in dataset
+        ]
+        for data_path, dataset in datasets.items()
+        for strategy in strategies
+    }
+
     # model_name = OLLAMA_MODEL
     for model_name in OLLAMA_MODELS:
         safe_model = sanitize_model_name(model_name)
+        warmup_model(model_name)
 
-        for data_path in DATA_PATHs:
-            with open(data_path, "r") as f:
-                data_json = json.load(f)
-
-            dataset = data_json.get("code_examples", data_json)
-
-            # Extract violation name from filename (e.g., "srp" from "data/srp_violations.json")
-            violation_name = os.path.splitext(os.path.basename(data_path))[0].split('_')[0]
+        for violation_name, data_path in DATASET_FILES:
+            dataset = datasets[data_path]
 
             for strategy in strategies:
                 output_dir = os.path.join("completions/test", f"{violation_name}--{safe_model}--{strategy}")
                 os.makedirs(output_dir, exist_ok=True)
                 output_path = os.path.join(output_dir, "output_test.jsonl")
-
-                with open(output_path, "a") as out_f:
-                    for idx, example in enumerate(dataset):
-                        start_time = time.time()
-
-                        language = example.get("language", "Java")
-                        src = example["input"]
-                        # src += "\n This code has the following violation type: %s" % (example["violation"])
-                        prompt = build_prompt(strategy, src, language)
-
-                        final_response = run_ollama(prompt, model_name)
-                        explanation = extract_explanation(final_response)
-                        code_block = "NO FIX VERSION"  # Placeholder for code block extraction
-
-                        duration = time.time() - start_time
-                        
-                        entry = {
-                            "id": idx,
-                            "strategy": strategy,
-                            "violation_type": violation_name,
-                            "model": model_name,
-                            "language": language,
-                            "input": example["input"],
-                            "prompt": prompt,
-                            "raw_response": final_response,
-                            "violation": extract_violation(final_response),
-                            "violation_list": extract_violation(final_response, return_list=True),
-                            "explanation": explanation,
-                            "solution_code": code_block,
-                            "duration_seconds": duration
-                        }
-
-                        out_f.write(json.dumps(entry) + "\n")
-                        print(f"✓ [{violation_name}] [{strategy}] {model_name} | {idx + 1}/{len(dataset)} in {duration:.2f}s")
+                completed_ids = load_completed_ids(output_path)
+
+                # Binary append with a 1 MiB buffer: entries are a few KB each,
+                # so this batches many of them per syscall.
+                with open(output_path, "ab", buffering=1 << 20) as out_f, \
+                        ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                    strategy_prompts = prompts[(data_path, strategy)]
+                    futures = [
+                        executor.submit(process_example, idx, example, strategy_prompts[idx],
+                                        strategy, violation_name, model_name)
+                        for idx, example in enumerate(dataset)
+                        if idx not in completed_ids
+                    ]
+                    # Futures are consumed in submission order so the JSONL stays ordered;
+                    # writes happen only in the main thread. A progress bar replaces the
+                    # per-example print, which flushes stdout on every completion.
+                    for future in tqdm(futures, desc=f"{violation_name}/{safe_model}/{strategy}"):
+                        entry = future.result()
+                        out_f.write(dump_jsonl_entry(entry))
+
+        unload_model(model_name)
 
 
 
@@ -2,6 +2,13 @@ import json
 import pandas as pd
 from collections import Counter
 
+# orjson decodes/encodes large nested JSON several times faster than stdlib;
+# fall back to stdlib json when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # === CONFIG ===
 csv_path = 'reprocess_dip/dip_combined_manual_review_completed.csv'
 json_path = 'detailed_results_v5_updated.json'
@@ -20,68 +27,87 @@ LANGUAGE_MAP = {
 
 # === LOAD FILES ===
 df = pd.read_csv(csv_path)
-with open(json_path, 'r') as f:
-    data = json.load(f)
+if orjson is not None:
+    with open(json_path, 'rb') as f:
+        data = orjson.loads(f.read())
+else:
+    with open(json_path, 'r') as f:
+        data = json.load(f)
 
 # === TRACKING ===
-unmatched = []
+# Record only (row index, reason); the unmatched DataFrame is built in one
+# slice at the end instead of a row.to_dict() per unmatched row.
+unmatched_idx = []
+unmatched_reason = []
 updated = 0
 
-# === MAIN LOOP ===
-for idx, row in df.iterrows():
-    # Extract and normalize fields
-    raw_model = str(row['file/model']).strip()
-    strategy = str(row['strategy']).strip().lower()
-    raw_language = str(row['language']).strip().upper().replace(" ", "").replace("_", "")
-    language = LANGUAGE_MAP.get(raw_language, raw_language)
-    sample_id = int(row['id'])
-    expected_violation = str(row['expected_violation']).strip().upper()
-    match_value = row['violation_match']
-
-    # Normalize model for JSON key
-    model_clean = raw_model.replace(":", "-").lower()
-    json_key = f"{expected_violation.lower()}--{model_clean}--{strategy}"
+# === NORMALIZE COLUMNS (vectorized) ===
+df['model_clean'] = df['file/model'].astype(str).str.strip().str.replace(':', '-', regex=False).str.lower()
+df['strategy'] = df['strategy'].astype(str).str.strip().str.lower()
+df['expected_violation'] = df['expected_violation'].astype(str).str.strip().str.upper()
+raw_language = df['language'].astype(str).str.strip().str.upper().str.replace(r'[\s_]', '', regex=True)
+df['language'] = raw_language.map(LANGUAGE_MAP).fillna(raw_language)
+df['json_key'] = df['expected_violation'].str.lower() + '--' + df['model_clean'] + '--' + df['strategy']
 
+# === MAIN LOOP ===
+# Group rows by their JSON key so each violation block is located once per
+# group instead of once per CSV row.
+for json_key, sub in df.groupby('json_key', sort=False):
     # Navigate JSON hierarchy: violation -> model+strategy key -> strategy -> violation -> items
     if json_key not in data:
-        unmatched.append({**row.to_dict(), "reason": f"JSON key '{json_key}' not found"})
+        for idx in sub.index:
+            unmatched_idx.append(idx)
+            unmatched_reason.append(f"JSON key '{json_key}' not found")
         continue
 
+    strategy = sub['strategy'].iloc[0]
+    expected_violation = sub['expected_violation'].iloc[0]
     strategy_block = data[json_key].get(strategy, {})
     violation_block = strategy_block.get("violation_results", {}).get(expected_violation.lower(), {})
     items = violation_block.get("items", [])
+    # Index items by id once per block: O(1) lookups instead of a linear
+    # scan for every CSV row that lands in the same block.
+    id_map = {item["id"]: item for item in items}
+
+    for idx, row in sub.iterrows():
+        sample_id = int(row['id'])
+        language = row['language']
+        match_value = row['violation_match']
 
-    match_found = False
-    for item in items:
-        if item["id"] == sample_id:
+        item = id_map.get(sample_id)
+        if item is not None:
             item["violation_match"] = bool(match_value)
             updated += 1
-            match_found = True
 
             # Optional: log language mismatch but do not block update
             json_lang = item.get("language", "").strip().upper()
             if json_lang != language:
-                unmatched.append({**row.to_dict(), "reason": f"Language mismatch: CSV={language}, JSON={json_lang} (updated anyway)"})
-            break
-
-    if not match_found:
-        unmatched.append({**row.to_dict(), "reason": "Matching ID not found in violation block"})
+                unmatched_idx.append(idx)
+                unmatched_reason.append(f"Language mismatch: CSV={language}, JSON={json_lang} (updated anyway)")
+        else:
+            unmatched_idx.append(idx)
+            unmatched_reason.append("Matching ID not found in violation block")
 
 # === SAVE OUTPUTS ===
-with open(output_json_path, 'w') as f:
-    json.dump(data, f, indent=2)
+if orjson is not None:
+    with open(output_json_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+else:
+    with open(output_json_path, 'w') as f:
+        json.dump(data, f, indent=2)
 
-if unmatched:
-    unmatched_df = pd.DataFrame(unmatched)
+if unmatched_idx:
+    unmatched_df = df.loc[unmatched_idx].copy()
+    unmatched_df["reason"] = unmatched_reason
     unmatched_df.to_csv(unmatched_log_path, index=False)
 
 # === SUMMARY ===
 print(f"\n✅ Updated {updated} entries.")
-print(f"⚠️ {len(unmatched)} unmatched entries logged to '{unmatched_log_path}'")
+print(f"⚠️ {len(unmatched_idx)} unmatched entries logged to '{unmatched_log_path}'")
 
 # Optional: reason breakdown
-if unmatched:
-    reason_counts = Counter([u["reason"] for u in unmatched])
+if unmatched_idx:
+    reason_counts = Counter(unmatched_reason)
     print("\n🔍 Breakdown of unmatched reasons:")
     for reason, count in reason_counts.items():
         print(f"  {reason}: {count}")
@@ -1,9 +1,27 @@
 
+import sys
+
 import pandas as pd
+import matplotlib
+# Agg renders straight to raster without starting a GUI event loop, which is
+# all we need for batch report generation; pass --interactive to get windows.
+INTERACTIVE = '--interactive' in sys.argv
+if not INTERACTIVE:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import os
+import matplotlib.colors as mcolors
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+
+# Polars reads the CSV lazily with projection pushdown (only the columns we
+# use are parsed); fall back to pandas when it isn't installed.
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 
 """
@@ -21,16 +39,78 @@ Input file: cyclomatic_complexity_results.csv
 
 # Configuration
 INPUT_FILE = 'cyclomatic_complexity_results.csv'
+# The analysis only touches these columns; everything else in the CSV is skipped at parse time
+USED_COLUMNS = ['violation', 'level', 'language',
+                'input_code_length', 'output_code_length',
+                'input_complexity', 'output_complexity']
+# Narrow numeric dtypes at parse time: halves the bytes moved through
+# every downstream groupby/scan without changing any results
+CSV_DTYPES = {'input_code_length': 'int32', 'output_code_length': 'int32',
+              'input_complexity': 'float32', 'output_complexity': 'float32'}
 FIGURE_SIZE = (18, 12)
 COLORS = {'EASY': '#2E8B57', 'MODERATE': '#FF8C00', 'HARD': '#DC143C'}
+# Hex strings parsed to RGBA once at import; every scatter/patch call below
+# reuses the tuples instead of round-tripping through mcolors.to_rgba
+_COLOR_RGBA = {k: mcolors.to_rgba(v) for k, v in COLORS.items()}
+LEVELS = ['EASY', 'MODERATE', 'HARD']
+# Single seeded PCG64 generator shared by all jitter: faster than the legacy
+# global RandomState and makes the plots deterministic
+RNG = np.random.default_rng(0)
+JITTER = 0.1  # horizontal spread of the scatter overlays
+# Identical difficulty-level legend handles were rebuilt in every plot
+# function; construct them once per marker size and share the lists
+_LEGEND_HANDLES = [Line2D([0], [0], marker='o', color='w',
+                          markerfacecolor=_COLOR_RGBA[level], markersize=8, label=level)
+                   for level in LEVELS]
+_LEGEND_HANDLES_LARGE = [Line2D([0], [0], marker='o', color='w',
+                                markerfacecolor=_COLOR_RGBA[level], markersize=12, label=level)
+                         for level in LEVELS]
+PLOTS_DIR = 'plots'
 OUTPUT_FILE = 'plots/code_length_analysis.png'  # Optional: save plot
 COMPLEXITY_OUTPUT_FILE = 'plots/cyclomatic_complexity_analysis.png'
 
 
 def load_data(file_path):
-    """Load and validate the CSV data."""
+    """Load and validate the CSV data.
+
+    A Parquet copy of the fully-prepared frame is cached next to the CSV;
+    repeat runs reload it with a typed columnar read instead of reparsing
+    text, as long as the CSV hasn't changed since the cache was written.
+    """
+    cache = file_path + '.parquet'
+    try:
+        if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(file_path):
+            df = pd.read_parquet(cache)
+            print(f"Successfully loaded {len(df)} records from {cache}")
+            return df
+    except Exception:
+        pass  # unreadable/stale cache: fall through to the CSV parse
     try:
-        df = pd.read_csv(file_path)
+        if pl is not None:
+            df = (pl.scan_csv(file_path)
+                    .select(USED_COLUMNS)
+                    .collect()
+                    .to_pandas())
+        else:
+            try:
+                # Arrow's CSV reader parses in parallel; keep the default C
+                # engine as a last resort when pyarrow isn't installed
+                df = pd.read_csv(file_path, usecols=USED_COLUMNS, dtype=CSV_DTYPES, engine='pyarrow')
+            except ImportError:
+                df = pd.read_csv(file_path, usecols=USED_COLUMNS, dtype=CSV_DTYPES)
+        # Categorical codes make every downstream mask/groupby compare int8
+        # codes instead of Python strings
+        df['violation'] = df['violation'].astype('category')
+        df['level'] = pd.Categorical(df['level'], categories=LEVELS, ordered=True)
+        # Derived columns computed once here instead of per plot/statistics pass
+        df['length_change'] = df['output_code_length'] - df['input_code_length']
+        df['complexity_change'] = df['output_complexity'] - df['input_complexity']
+        # Best effort: categoricals and derived columns round-trip through
+        # Parquet, so the next run skips the parse and the prep above
+        try:
+            df.to_parquet(cache)
+        except Exception:
+            pass  # no parquet engine installed or read-only directory
         print(f"Successfully loaded {len(df)} records from {file_path}")
         return df
     except FileNotFoundError:
@@ -41,44 +121,193 @@ def load_data(file_path):
         return None
 
 
-def create_scatter_plot(df, ax, x_col, y_col, title):
+def _row_at_argmax(df, col):
+    """Row at the column's maximum: one argmax scan on the raw array
+    instead of idxmax plus a label-based row lookup."""
+    return df.iloc[int(df[col].to_numpy().argmax())]
+
+
+def _row_at_argmin(df, col):
+    """Row at the column's minimum; see _row_at_argmax."""
+    return df.iloc[int(df[col].to_numpy().argmin())]
+
+
+def finish_figure(fig):
+    """Show the figure when run with --interactive, otherwise close it.
+
+    Batch runs never enter the GUI event loop; closing releases the
+    figure's RGBA buffers so memory stays flat across the plot functions.
+    """
+    if INTERACTIVE:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+def box_stats(arr):
+    """Precompute bxp-style box statistics for one group of values.
+
+    One np.quantile call yields all three quartiles, and the Tukey
+    whiskers are clipped to the data; handing the ready-made dicts to
+    ax.bxp skips boxplot()'s per-group Python statistics pass.
+    """
+    q1, med, q3 = np.quantile(arr, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    whislo = arr[arr >= q1 - 1.5 * iqr].min()
+    whishi = arr[arr <= q3 + 1.5 * iqr].max()
+    return {'med': med, 'q1': q1, 'q3': q3,
+            'whislo': whislo, 'whishi': whishi, 'fliers': []}
+
+
+def group_arrays(df, y_col):
+    """Split y_col into one ndarray per (violation, level) group.
+
+    groupby.indices resolves each group's integer positions once; a
+    contiguous values.take per key then replaces the per-group boolean
+    masks and Series slices a filter-per-cell approach would allocate.
+    """
+    vals = df[y_col].to_numpy()
+    idx = df.groupby(['violation', 'level'], sort=False, observed=True).indices
+    return {key: vals.take(ind) for key, ind in idx.items()}
+
+
+def overlay_jittered_scatter(ax, data_list, levels, s=20):
+    """Overlay all groups' jittered points with a single scatter call.
+
+    One PathCollection per subplot instead of one per (violation, level)
+    cell; coordinates and colors are filled by slice assignment.
+    """
+    total = sum(len(data) for data in data_list)
+    xs = np.empty(total)
+    ys = np.empty(total)
+    cs = np.empty((total, 4))
+
+    start = 0
+    for pos, (data, level) in enumerate(zip(data_list, levels), start=1):
+        end = start + len(data)
+        xs[start:end] = pos
+        ys[start:end] = data
+        cs[start:end] = _COLOR_RGBA[level]
+        start = end
+
+    xs += RNG.standard_normal(total) * JITTER
+    ax.scatter(xs, ys, color=cs, alpha=0.6, s=s, zorder=3, rasterized=True)
+
+
+def group_mean(vcode, lcode, vals, nv, nl):
+    """Per-(violation, level) mean via bincount on fused int codes."""
+    flat = vcode.astype(np.intp) * nl + lcode
+    sums = np.bincount(flat, weights=vals, minlength=nv * nl)
+    counts = np.bincount(flat, minlength=nv * nl)
+    with np.errstate(invalid='ignore'):
+        means = sums / counts
+    return means.reshape(nv, nl)
+
+
+def grouped_stats_frame(df, by, cols):
+    """groupby(by)[cols].agg(['mean', 'std', 'min', 'max']) as NumPy scans.
+
+    One bincount/ufunc pass per column over the categorical codes replaces
+    the per-statistic pandas agg dispatches; the result is assembled into
+    the same MultiIndex-column frame pandas would print.
+    """
+    codes = df[by].cat.codes.to_numpy()
+    categories = df[by].cat.categories
+    n = len(categories)
+    counts = np.bincount(codes, minlength=n)
+    safe_counts = np.maximum(counts, 1)
+
+    data = {}
+    for col in cols:
+        vals = df[col].to_numpy(np.float64)
+        sums = np.bincount(codes, weights=vals, minlength=n)
+        sqsums = np.bincount(codes, weights=vals * vals, minlength=n)
+        mean = sums / safe_counts
+        # Sample variance (ddof=1) to match pandas' std
+        var = np.maximum(sqsums - counts * mean * mean, 0.0) / np.maximum(counts - 1, 1)
+        mins = np.full(n, np.inf)
+        np.minimum.at(mins, codes, vals)
+        maxs = np.full(n, -np.inf)
+        np.maximum.at(maxs, codes, vals)
+        data[(col, 'mean')] = mean
+        data[(col, 'std')] = np.sqrt(var)
+        data[(col, 'min')] = mins
+        data[(col, 'max')] = maxs
+
+    return pd.DataFrame(data, index=pd.Index(categories, name=by))
+
+
+def mean_matrix(df, col):
+    """Average col per (violation, level) as a labelled DataFrame for heatmaps."""
+    categories = df['violation'].cat.categories
+    vcode = df['violation'].cat.codes.to_numpy(np.int16)
+    lcode = df['level'].cat.codes.to_numpy(np.int8)
+    means = group_mean(vcode, lcode, df[col].to_numpy(np.float64),
+                       len(categories), len(LEVELS))
+    return pd.DataFrame(means, index=categories, columns=LEVELS)
+
+
+def scatter_groups(ax, violation_types, groups, s=30, add_legend=False):
+    """Draw all (violation, level) cells as a single PathCollection.
+
+    Matplotlib draw time scales with artist count, so the cells are
+    concatenated into one xs/ys/colors set instead of one scatter artist
+    per cell. The legend is built from Patch proxies since there are no
+    per-level artists to label anymore.
+    """
+    cells = [(i, level, data)
+             for i, violation in enumerate(violation_types)
+             for level in LEVELS
+             for data in (groups.get((violation, level)),)
+             if data is not None and len(data) > 0]
+    total = sum(len(data) for _, _, data in cells)
+    xs = np.empty(total)
+    ys = np.empty(total)
+    cs = np.empty((total, 4))
+
+    start = 0
+    for i, level, data in cells:
+        end = start + len(data)
+        xs[start:end] = i
+        ys[start:end] = data
+        cs[start:end] = _COLOR_RGBA[level]
+        start = end
+
+    ax.scatter(xs, ys, color=cs, alpha=0.6, s=s, rasterized=True)
+    if add_legend:
+        ax.legend(handles=[Patch(color=_COLOR_RGBA[level], label=level) for level in LEVELS])
+
+
+def create_scatter_plot(df, violation_types, ax, y_col, title):
     """Create a scatter plot for code lengths by violation type and level."""
-    violation_types = df['violation'].unique()
-    
-    for i, violation in enumerate(violation_types):
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)][y_col]
-            if not data.empty:
-                ax.scatter([i] * len(data), data, alpha=0.6, color=COLORS[level], 
-                          label=level if i == 0 else "", s=30)
-    
+    groups = group_arrays(df, y_col)
+    scatter_groups(ax, violation_types, groups, s=30, add_legend='input' in y_col.lower())
+
     ax.set_xlabel('Violation Type')
     ax.set_ylabel(y_col.replace('_', ' ').title())
     ax.set_title(title)
     ax.set_xticks(range(len(violation_types)))
     ax.set_xticklabels(violation_types)
-    if 'input' in y_col.lower():
-        ax.legend()
     ax.grid(True, alpha=0.3)
 
 
-def create_box_plot(df, ax, y_col, title):
+def create_box_plot(df, violation_types, ax, y_col, title):
     """Create a box plot for code lengths."""
-    violation_types = df['violation'].unique()
+    groups = group_arrays(df, y_col)
     data_list = []
     labels = []
-    
+
     for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)][y_col]
-            if not data.empty:
+        for level in LEVELS:
+            data = groups.get((violation, level))
+            if data is not None and len(data) > 0:
                 data_list.append(data)
                 labels.append(f'{violation}\n{level}')
     
     bp = ax.boxplot(data_list, labels=labels, patch_artist=True)
     for patch, label in zip(bp['boxes'], labels):
         level = label.split('\n')[1]
-        patch.set_facecolor(COLORS[level])
+        patch.set_facecolor(_COLOR_RGBA[level])
         patch.set_alpha(0.7)
     
     ax.set_title(title)
@@ -86,53 +315,133 @@ def create_box_plot(df, ax, y_col, title):
     plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
 
-def create_heatmap(df, ax, col, title):
-    """Create a heatmap of average code lengths."""
-    pivot_data = df.groupby(['violation', 'level'])[col].mean().reset_index()
-    pivot_data = pivot_data.pivot(index='violation', columns='level', values=col)
-    
-    sns.heatmap(pivot_data, annot=True, fmt='.0f', cmap='YlOrRd', ax=ax, 
-                cbar_kws={'label': 'Average Length'})
+# Annotation format, colormap and colorbar label per heatmap column
+HEATMAP_STYLES = {
+    'input_code_length': ('.0f', 'YlOrRd', 'Average Length'),
+    'input_complexity': ('.1f', 'Reds', 'Average Complexity'),
+    'output_complexity': ('.1f', 'Blues', 'Average Complexity'),
+}
+
+
+def create_heatmap(df, violation_types, ax, col, title):
+    """Create a heatmap of per-(violation, level) averages."""
+    fmt, cmap, cbar_label = HEATMAP_STYLES[col]
+    sns.heatmap(mean_matrix(df, col), annot=True, fmt=fmt, cmap=cmap, ax=ax,
+                cbar_kws={'label': cbar_label})
     ax.set_title(title)
     ax.set_xlabel('Difficulty Level')
     ax.set_ylabel('Violation Type')
 
 
-def create_length_change_plot(df, ax):
-    """Create a plot showing code length changes after fixing violations."""
-    df['length_change'] = df['output_code_length'] - df['input_code_length']
-    violation_types = df['violation'].unique()
-    
-    for i, violation in enumerate(violation_types):
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['length_change']
-            if not data.empty:
-                ax.scatter([i] * len(data), data, alpha=0.6, color=COLORS[level], s=30)
-    
+def create_delta_plot(df, violation_types, ax, y_col, title):
+    """Create a plot showing per-sample changes after fixing violations."""
+    groups = group_arrays(df, y_col)
+    scatter_groups(ax, violation_types, groups, s=30)
+
     ax.axhline(y=0, color='black', linestyle='--', alpha=0.5)
     ax.set_xlabel('Violation Type')
-    ax.set_ylabel('Length Change (Output - Input)')
-    ax.set_title('Code Length Change After Fix')
+    ax.set_ylabel(y_col.replace('_', ' ').title() + ' (Output - Input)')
+    ax.set_title(title)
     ax.set_xticks(range(len(violation_types)))
     ax.set_xticklabels(violation_types)
     ax.grid(True, alpha=0.3)
 
 
+def create_box_scatter_plot(df, violation_types, ax, y_col, title):
+    """Create a box plot with a jittered scatter overlay per (violation, level)."""
+    groups = group_arrays(df, y_col)
+    data_list = []
+    labels = []
+    levels = []
+    positions = []
+
+    for violation in violation_types:
+        for level in LEVELS:
+            data = groups.get((violation, level))
+            if data is not None and len(data) > 0:
+                data_list.append(data)
+                labels.append(f'{violation}\n{level}')
+                levels.append(level)
+                positions.append(len(positions) + 1)
+
+    bp = ax.boxplot(data_list, positions=positions, patch_artist=True, widths=0.6)
+
+    # Color the boxes, then overlay every group's points in one scatter call
+    for patch, level in zip(bp['boxes'], levels):
+        patch.set_facecolor(_COLOR_RGBA[level])
+        patch.set_alpha(0.7)
+    overlay_jittered_scatter(ax, data_list, levels, s=20)
+
+    ax.set_title(title)
+    ax.set_ylabel(y_col.replace('_', ' ').title())
+    ax.set_xticks(positions)
+    ax.set_xticklabels(labels)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+
+def create_complexity_scatter(df, violation_types, ax, y_col, title):
+    """Create an input-vs-output complexity scatter with a no-change diagonal."""
+    for level in LEVELS:
+        data = df[df['level'] == level]
+        ax.scatter(data['input_complexity'], data['output_complexity'],
+                   alpha=0.6, color=_COLOR_RGBA[level], label=level, s=40, rasterized=True)
+
+    # Add diagonal line (y=x) to show no change
+    max_complexity = max(df['input_complexity'].max(), df['output_complexity'].max())
+    ax.plot([0, max_complexity], [0, max_complexity], 'k--', alpha=0.5, label='No Change')
+    ax.set_xlabel('Input Complexity')
+    ax.set_ylabel('Output Complexity')
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+PLOT_KINDS = {
+    'scatter': create_scatter_plot,
+    'box': create_box_plot,
+    'heatmap': create_heatmap,
+    'delta': create_delta_plot,
+    'boxscatter': create_box_scatter_plot,
+    'xy': create_complexity_scatter,
+}
+
+
+def grid_plot(df, suptitle, specs, output_file, save_plot=False):
+    """Build a 2x3 figure from (kind, column, title) specs.
+
+    Shared skeleton for the two comparison figures: violation order is
+    computed once and every subplot is dispatched through PLOT_KINDS.
+    """
+    fig, axes = plt.subplots(2, 3, figsize=FIGURE_SIZE, constrained_layout=True)
+    fig.suptitle(suptitle, fontsize=16, fontweight='bold')
+
+    violation_types = df['violation'].cat.categories
+    for ax, (kind, col, title) in zip(axes.flat, specs):
+        PLOT_KINDS[kind](df, violation_types, ax, col, title)
+
+    if save_plot:
+        fig.savefig(output_file, dpi=150, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 1})
+        print(f"Plot saved as {output_file}")
+
+    finish_figure(fig)
+
+
 def print_summary_statistics(df):
     """Print comprehensive summary statistics."""
     print("\n" + "="*50)
     print("SUMMARY STATISTICS")
     print("="*50)
     print(f"Total records: {len(df)}")
-    print(f"Violation types: {list(df['violation'].unique())}")
+    print(f"Violation types: {list(df['violation'].cat.categories)}")
     print(f"Difficulty levels: {list(df['level'].unique())}")
     print(f"Languages: {list(df['language'].unique())}")
     
     print("\n" + "="*50)
     print("HIGHEST CODE LENGTHS")
     print("="*50)
-    max_input = df.loc[df['input_code_length'].idxmax()]
-    max_output = df.loc[df['output_code_length'].idxmax()]
+    max_input = _row_at_argmax(df, 'input_code_length')
+    max_output = _row_at_argmax(df, 'output_code_length')
     
     print(f"Highest input code length: {max_input['input_code_length']} characters")
     print(f"  - Violation: {max_input['violation']}, Level: {max_input['level']}, Language: {max_input['language']}")
@@ -154,38 +463,14 @@ def print_summary_statistics(df):
 
 def visualize_code_lengths(df, save_plot=False):
     """Create comprehensive visualization of code length distributions."""
-    # Create figure with subplots
-    fig, axes = plt.subplots(2, 3, figsize=FIGURE_SIZE)
-    fig.suptitle('Code Length Distribution by Violation Type and Difficulty Level', 
-                 fontsize=16, fontweight='bold')
-    
-    # Plot 1: Input Code Length Scatter Plot
-    create_scatter_plot(df, axes[0, 0], 'violation', 'input_code_length', 
-                       'Input Code Length Distribution')
-    
-    # Plot 2: Output Code Length Scatter Plot
-    create_scatter_plot(df, axes[0, 1], 'violation', 'output_code_length', 
-                       'Output Code Length Distribution')
-    
-    # Plot 3: Input Code Length Box Plot
-    create_box_plot(df, axes[0, 2], 'input_code_length', 'Input Code Length Box Plot')
-    
-    # Plot 4: Output Code Length Box Plot
-    create_box_plot(df, axes[1, 0], 'output_code_length', 'Output Code Length Box Plot')
-    
-    # Plot 5: Heatmap of Average Input Code Lengths
-    create_heatmap(df, axes[1, 1], 'input_code_length', 'Average Input Code Length Heatmap')
-    
-    # Plot 6: Code Length Change Plot
-    create_length_change_plot(df, axes[1, 2])
-    
-    plt.tight_layout()
-    
-    if save_plot:
-        plt.savefig(OUTPUT_FILE, dpi=300, bbox_inches='tight')
-        print(f"Plot saved as {OUTPUT_FILE}")
-    
-    plt.show()
+    grid_plot(df, 'Code Length Distribution by Violation Type and Difficulty Level',
+              [('scatter', 'input_code_length', 'Input Code Length Distribution'),
+               ('scatter', 'output_code_length', 'Output Code Length Distribution'),
+               ('box', 'input_code_length', 'Input Code Length Box Plot'),
+               ('box', 'output_code_length', 'Output Code Length Box Plot'),
+               ('heatmap', 'input_code_length', 'Average Input Code Length Heatmap'),
+               ('delta', 'length_change', 'Code Length Change After Fix')],
+              OUTPUT_FILE, save_plot)
 
 
 def create_complexity_comparison_plots(df, save_plot=False):
@@ -193,161 +478,15 @@ def create_complexity_comparison_plots(df, save_plot=False):
     # Ensure plots directory exists
     if save_plot:
         os.makedirs('plots', exist_ok=True)
-    
-    # Create figure with subplots for complexity analysis
-    fig, axes = plt.subplots(2, 3, figsize=FIGURE_SIZE)
-    fig.suptitle('Cyclomatic Complexity Analysis: Before vs After SOLID Violation Fixes', 
-                 fontsize=16, fontweight='bold')
-    
-    violation_types = df['violation'].unique()
-    
-    # Plot 1: Input vs Output Complexity Scatter Plot
-    ax1 = axes[0, 0]
-    for level in ['EASY', 'MODERATE', 'HARD']:
-        data = df[df['level'] == level]
-        ax1.scatter(data['input_complexity'], data['output_complexity'], 
-                   alpha=0.6, color=COLORS[level], label=level, s=40)
-    
-    # Add diagonal line (y=x) to show no change
-    max_complexity = max(df['input_complexity'].max(), df['output_complexity'].max())
-    ax1.plot([0, max_complexity], [0, max_complexity], 'k--', alpha=0.5, label='No Change')
-    ax1.set_xlabel('Input Complexity')
-    ax1.set_ylabel('Output Complexity') 
-    ax1.set_title('Input vs Output Complexity')
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-    
-    # Plot 2: Complexity Change by Violation Type
-    ax2 = axes[0, 1]
-    df['complexity_change'] = df['output_complexity'] - df['input_complexity']
-    
-    for i, violation in enumerate(violation_types):
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['complexity_change']
-            if not data.empty:
-                ax2.scatter([i] * len(data), data, alpha=0.6, color=COLORS[level], s=30)
-    
-    ax2.axhline(y=0, color='black', linestyle='--', alpha=0.5)
-    ax2.set_xlabel('Violation Type')
-    ax2.set_ylabel('Complexity Change (Output - Input)')
-    ax2.set_title('Complexity Change After Fix')
-    ax2.set_xticks(range(len(violation_types)))
-    ax2.set_xticklabels(violation_types)
-    ax2.grid(True, alpha=0.3)
-    
-    # Plot 3: Box Plot + Scatter of Input Complexity by Violation and Level
-    ax3 = axes[0, 2]
-    complexity_data = []
-    labels = []
-    positions = []
-    pos = 1
-    
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
-                complexity_data.append(data)
-                labels.append(f'{violation}\n{level}')
-                positions.append(pos)
-                pos += 1
-    
-    # Create box plot
-    bp1 = ax3.boxplot(complexity_data, positions=positions, patch_artist=True, widths=0.6)
-    
-    # Color the boxes and add scatter points
-    pos = 1
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
-                # Color the box
-                if pos <= len(bp1['boxes']):
-                    bp1['boxes'][pos-1].set_facecolor(COLORS[level])
-                    bp1['boxes'][pos-1].set_alpha(0.7)
-                
-                # Add scatter points with jitter
-                jitter = np.random.normal(0, 0.1, len(data))
-                ax3.scatter([pos] * len(data) + jitter, data, 
-                           alpha=0.6, color=COLORS[level], s=20, zorder=3)
-                pos += 1
-    
-    ax3.set_title('Input Complexity Distribution (Box + Scatter)')
-    ax3.set_ylabel('Input Complexity')
-    ax3.set_xticks(positions)
-    ax3.set_xticklabels(labels)
-    plt.setp(ax3.get_xticklabels(), rotation=45, ha='right')
-    
-    # Plot 4: Heatmap of Average Input Complexity
-    ax4 = axes[1, 0]
-    pivot_input_complexity = df.groupby(['violation', 'level'])['input_complexity'].mean().reset_index()
-    pivot_input_complexity = pivot_input_complexity.pivot(index='violation', columns='level', values='input_complexity')
-    
-    sns.heatmap(pivot_input_complexity, annot=True, fmt='.1f', cmap='Reds', ax=ax4, 
-                cbar_kws={'label': 'Average Complexity'})
-    ax4.set_title('Average Input Complexity Heatmap')
-    ax4.set_xlabel('Difficulty Level')
-    ax4.set_ylabel('Violation Type')
-    
-    # Plot 5: Heatmap of Average Output Complexity
-    ax5 = axes[1, 1]
-    pivot_output_complexity = df.groupby(['violation', 'level'])['output_complexity'].mean().reset_index()
-    pivot_output_complexity = pivot_output_complexity.pivot(index='violation', columns='level', values='output_complexity')
-    
-    sns.heatmap(pivot_output_complexity, annot=True, fmt='.1f', cmap='Blues', ax=ax5, 
-                cbar_kws={'label': 'Average Complexity'})
-    ax5.set_title('Average Output Complexity Heatmap')
-    ax5.set_xlabel('Difficulty Level')
-    ax5.set_ylabel('Violation Type')
-    
-    # Plot 6: Box Plot + Scatter of Output Complexity by Violation and Level
-    ax6 = axes[1, 2]
-    output_complexity_data = []
-    output_labels = []
-    output_positions = []
-    pos = 1
-    
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['output_complexity']
-            if not data.empty:
-                output_complexity_data.append(data)
-                output_labels.append(f'{violation}\n{level}')
-                output_positions.append(pos)
-                pos += 1
-    
-    # Create box plot
-    bp2 = ax6.boxplot(output_complexity_data, positions=output_positions, patch_artist=True, widths=0.6)
-    
-    # Color the boxes and add scatter points
-    pos = 1
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['output_complexity']
-            if not data.empty:
-                # Color the box
-                if pos <= len(bp2['boxes']):
-                    bp2['boxes'][pos-1].set_facecolor(COLORS[level])
-                    bp2['boxes'][pos-1].set_alpha(0.7)
-                
-                # Add scatter points with jitter
-                jitter = np.random.normal(0, 0.1, len(data))
-                ax6.scatter([pos] * len(data) + jitter, data, 
-                           alpha=0.6, color=COLORS[level], s=20, zorder=3)
-                pos += 1
-    
-    ax6.set_title('Output Complexity Distribution (Box + Scatter)')
-    ax6.set_ylabel('Output Complexity')
-    ax6.set_xticks(output_positions)
-    ax6.set_xticklabels(output_labels)
-    plt.setp(ax6.get_xticklabels(), rotation=45, ha='right')
-    
-    plt.tight_layout()
-    
-    if save_plot:
-        plt.savefig(COMPLEXITY_OUTPUT_FILE, dpi=300, bbox_inches='tight')
-        print(f"Complexity analysis plot saved as {COMPLEXITY_OUTPUT_FILE}")
-    
-    plt.show()
+
+    grid_plot(df, 'Cyclomatic Complexity Analysis: Before vs After SOLID Violation Fixes',
+              [('xy', 'input_complexity', 'Input vs Output Complexity'),
+               ('delta', 'complexity_change', 'Complexity Change After Fix'),
+               ('boxscatter', 'input_complexity', 'Input Complexity Distribution (Box + Scatter)'),
+               ('heatmap', 'input_complexity', 'Average Input Complexity Heatmap'),
+               ('heatmap', 'output_complexity', 'Average Output Complexity Heatmap'),
+               ('boxscatter', 'output_complexity', 'Output Complexity Distribution (Box + Scatter)')],
+              COMPLEXITY_OUTPUT_FILE, save_plot)
 
 
 def print_complexity_statistics(df):
@@ -356,22 +495,27 @@ def print_complexity_statistics(df):
     print("CYCLOMATIC COMPLEXITY ANALYSIS")
     print("="*60)
     
-    # Calculate complexity changes
-    df['complexity_change'] = df['output_complexity'] - df['input_complexity']
-    df['complexity_reduction_percent'] = ((df['input_complexity'] - df['output_complexity']) / df['input_complexity']) * 100
+    # complexity_change is precomputed in load_data. Zero-complexity inputs
+    # would otherwise divide by zero and leak inf/nan into the means below;
+    # np.maximum keeps the divisor safe without a branch.
+    inp = df['input_complexity'].to_numpy()
+    out = df['output_complexity'].to_numpy()
+    df['complexity_reduction_percent'] = np.where(
+        inp > 0, (inp - out) / np.maximum(inp, 1) * 100.0, 0.0)
     
     print(f"Total records analyzed: {len(df)}")
-    
-    # Overall complexity statistics
-    print(f"\nOverall Input Complexity: Mean={df['input_complexity'].mean():.2f}, Max={df['input_complexity'].max()}")
-    print(f"Overall Output Complexity: Mean={df['output_complexity'].mean():.2f}, Max={df['output_complexity'].max()}")
-    print(f"Average Complexity Change: {df['complexity_change'].mean():.2f}")
+
+    # Overall complexity statistics in one aggregation pass
+    overall = df[['input_complexity', 'output_complexity', 'complexity_change']].agg(['mean', 'max'])
+    print(f"\nOverall Input Complexity: Mean={overall.at['mean', 'input_complexity']:.2f}, Max={overall.at['max', 'input_complexity']}")
+    print(f"Overall Output Complexity: Mean={overall.at['mean', 'output_complexity']:.2f}, Max={overall.at['max', 'output_complexity']}")
+    print(f"Average Complexity Change: {overall.at['mean', 'complexity_change']:.2f}")
     
     # Find extremes
-    max_input_complexity = df.loc[df['input_complexity'].idxmax()]
-    max_output_complexity = df.loc[df['output_complexity'].idxmax()]
-    max_increase = df.loc[df['complexity_change'].idxmax()]
-    max_decrease = df.loc[df['complexity_change'].idxmin()]
+    max_input_complexity = _row_at_argmax(df, 'input_complexity')
+    max_output_complexity = _row_at_argmax(df, 'output_complexity')
+    max_increase = _row_at_argmax(df, 'complexity_change')
+    max_decrease = _row_at_argmin(df, 'complexity_change')
     
     print(f"\n" + "="*60)
     print("COMPLEXITY EXTREMES")
@@ -392,14 +536,14 @@ def print_complexity_statistics(df):
     print(f"\n" + "="*60)
     print("COMPLEXITY BY VIOLATION TYPE")
     print("="*60)
-    complexity_by_violation = df.groupby('violation')[['input_complexity', 'output_complexity', 'complexity_change']].agg(['mean', 'std', 'min', 'max'])
+    complexity_by_violation = grouped_stats_frame(df, 'violation', ['input_complexity', 'output_complexity', 'complexity_change'])
     print(complexity_by_violation.round(2))
     
     # Statistics by difficulty level
     print(f"\n" + "="*60)
     print("COMPLEXITY BY DIFFICULTY LEVEL")
     print("="*60)
-    complexity_by_level = df.groupby('level')[['input_complexity', 'output_complexity', 'complexity_change']].agg(['mean', 'std', 'min', 'max'])
+    complexity_by_level = grouped_stats_frame(df, 'level', ['input_complexity', 'output_complexity', 'complexity_change'])
     print(complexity_by_level.round(2))
     
     # Effectiveness analysis
@@ -407,66 +551,58 @@ def print_complexity_statistics(df):
     print("COMPLEXITY REDUCTION EFFECTIVENESS")
     print("="*60)
     
-    improved = df[df['complexity_change'] < 0]
-    worsened = df[df['complexity_change'] > 0]
-    unchanged = df[df['complexity_change'] == 0]
-    
-    print(f"Cases with improved complexity: {len(improved)} ({len(improved)/len(df)*100:.1f}%)")
-    print(f"Cases with worsened complexity: {len(worsened)} ({len(worsened)/len(df)*100:.1f}%)")
-    print(f"Cases with unchanged complexity: {len(unchanged)} ({len(unchanged)/len(df)*100:.1f}%)")
-    
-    if len(improved) > 0:
-        print(f"Average improvement: {improved['complexity_change'].mean():.2f} ({improved['complexity_reduction_percent'].mean():.1f}%)")
-    if len(worsened) > 0:
-        print(f"Average worsening: {worsened['complexity_change'].mean():.2f}")
+    # Count outcomes on the raw array instead of materializing three
+    # filtered frames just to take their lengths
+    change = df['complexity_change'].to_numpy()
+    improved_mask = change < 0
+    worsened_mask = change > 0
+    n_improved = int(improved_mask.sum())
+    n_worsened = int(worsened_mask.sum())
+    n_unchanged = len(df) - n_improved - n_worsened
+
+    print(f"Cases with improved complexity: {n_improved} ({n_improved/len(df)*100:.1f}%)")
+    print(f"Cases with worsened complexity: {n_worsened} ({n_worsened/len(df)*100:.1f}%)")
+    print(f"Cases with unchanged complexity: {n_unchanged} ({n_unchanged/len(df)*100:.1f}%)")
 
+    if n_improved > 0:
+        reduction = df['complexity_reduction_percent'].to_numpy()
+        print(f"Average improvement: {change[improved_mask].mean():.2f} ({reduction[improved_mask].mean():.1f}%)")
+    if n_worsened > 0:
+        print(f"Average worsening: {change[worsened_mask].mean():.2f}")
 
-def compare_cyclomatic_complexity(file_path=INPUT_FILE, save_plot=False):
+
+def compare_cyclomatic_complexity(df, save_plot=False):
     """Main function to analyze and compare cyclomatic complexity."""
-    # Load data
-    df = load_data(file_path)
-    if df is None:
-        return
-    
     # Create complexity visualizations
     create_complexity_comparison_plots(df, save_plot)
-    
+
     # Print detailed statistics
     print_complexity_statistics(df)
 
 
-def analyze_code_complexity(file_path=INPUT_FILE, save_plot=False):
+def analyze_code_complexity(df, save_plot=False):
     """Main analysis function."""
     # Ensure plots directory exists
     if save_plot:
         os.makedirs('plots', exist_ok=True)
-    
-    # Load data
-    df = load_data(file_path)
-    if df is None:
-        return
-    
+
     # Create visualizations
     visualize_code_lengths(df, save_plot)
-    
+
     # Print statistics
     print_summary_statistics(df)
 
 
 
 if __name__ == "__main__":
-    # Run the code length analysis
-    analyze_code_complexity(
-        file_path=INPUT_FILE,
-        save_plot=True
-    )
-    
-    # Run the cyclomatic complexity comparison
-    compare_cyclomatic_complexity(
-        file_path=INPUT_FILE,
-        save_plot=True
-    )
+    # Parse the CSV once and share the frame between both analyses
+    df = load_data(INPUT_FILE)
+    if df is not None:
+        # Run the code length analysis
+        analyze_code_complexity(df, save_plot=True)
 
+        # Run the cyclomatic complexity comparison
+        compare_cyclomatic_complexity(df, save_plot=True)
 
 
 
@@ -487,12 +623,6 @@ if __name__ == "__main__":
 
 
 
-
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-import os
 
 
 """
@@ -501,93 +631,55 @@ Individual Input Distribution Analysis for SOLID Principles Dataset
 This script creates individual plots for:
 1. Input complexity distribution
 2. Input code length distribution
-
-Required libraries: pandas, matplotlib, seaborn, numpy
-Input file: cyclomatic_complexity_results.csv
 """
 
-# Configuration
-INPUT_FILE = 'cyclomatic_complexity_results.csv'
-COLORS = {'EASY': '#2E8B57', 'MODERATE': '#FF8C00', 'HARD': '#DC143C'}
-PLOTS_DIR = 'plots'
-
-
-def load_data(file_path):
-    """Load and validate the CSV data."""
-    try:
-        df = pd.read_csv(file_path)
-        print(f"Successfully loaded {len(df)} records from {file_path}")
-        return df
-    except FileNotFoundError:
-        print(f"Error: File {file_path} not found!")
-        return None
-    except Exception as e:
-        print(f"Error loading data: {e}")
-        return None
-
 
 def plot_input_complexity_distribution(df, save_plot=False):
     """Create comprehensive input complexity distribution plot."""
     
     # Create figure with subplots
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12), constrained_layout=True)
     fig.suptitle('Input Complexity Distribution Analysis', fontsize=16, fontweight='bold')
     
-    violation_types = df['violation'].unique()
-    
+    violation_types = df['violation'].cat.categories
+    groups = group_arrays(df, 'input_complexity')
+
     # Plot 1: Scatter plot by violation type and level
     ax1 = axes[0, 0]
-    for i, violation in enumerate(violation_types):
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
-                ax1.scatter([i] * len(data), data, alpha=0.6, color=COLORS[level], 
-                          label=level if i == 0 else "", s=40)
-    
+    scatter_groups(ax1, violation_types, groups, s=40, add_legend=True)
+
     ax1.set_xlabel('Violation Type')
     ax1.set_ylabel('Input Complexity')
     # ax1.set_title('Input Complexity by Violation Type and Level')
     ax1.set_xticks(range(len(violation_types)))
     ax1.set_xticklabels(violation_types)
-    ax1.legend()
     ax1.grid(True, alpha=0.3)
-    
+
     # Plot 2: Box plot with scatter overlay
     ax2 = axes[0, 1]
     complexity_data = []
     labels = []
+    levels = []
     positions = []
-    pos = 1
-    
+
     for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
+        for level in LEVELS:
+            data = groups.get((violation, level))
+            if data is not None and len(data) > 0:
                 complexity_data.append(data)
                 labels.append(f'{violation}\n{level}')
-                positions.append(pos)
-                pos += 1
-    
+                levels.append(level)
+                positions.append(len(positions) + 1)
+
     # Create box plot
     bp = ax2.boxplot(complexity_data, positions=positions, patch_artist=True, widths=0.6)
-    
-    # Color the boxes and add scatter points
-    pos = 1
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
-                # Color the box
-                if pos <= len(bp['boxes']):
-                    bp['boxes'][pos-1].set_facecolor(COLORS[level])
-                    bp['boxes'][pos-1].set_alpha(0.7)
-                
-                # Add scatter points with jitter
-                jitter = np.random.normal(0, 0.1, len(data))
-                ax2.scatter([pos] * len(data) + jitter, data, 
-                           alpha=0.6, color=COLORS[level], s=20, zorder=3)
-                pos += 1
-    
+
+    # Color the boxes, then overlay every group's points in one scatter call
+    for patch, level in zip(bp['boxes'], levels):
+        patch.set_facecolor(_COLOR_RGBA[level])
+        patch.set_alpha(0.7)
+    overlay_jittered_scatter(ax2, complexity_data, levels, s=20)
+
     ax2.set_title('Input Complexity Distribution (Box + Scatter)')
     ax2.set_ylabel('Input Complexity')
     ax2.set_xticks(positions)
@@ -596,10 +688,9 @@ def plot_input_complexity_distribution(df, save_plot=False):
     
     # Plot 3: Heatmap of average input complexity
     ax3 = axes[1, 0]
-    pivot_input_complexity = df.groupby(['violation', 'level'])['input_complexity'].mean().reset_index()
-    pivot_input_complexity = pivot_input_complexity.pivot(index='violation', columns='level', values='input_complexity')
-    
-    sns.heatmap(pivot_input_complexity, annot=True, fmt='.1f', cmap='Reds', ax=ax3, 
+    pivot_input_complexity = mean_matrix(df, 'input_complexity')
+
+    sns.heatmap(pivot_input_complexity, annot=True, fmt='.1f', cmap='Reds', ax=ax3,
                 cbar_kws={'label': 'Average Complexity'})
     ax3.set_title('Average Input Complexity Heatmap')
     ax3.set_xlabel('Difficulty Level')
@@ -607,90 +698,73 @@ def plot_input_complexity_distribution(df, save_plot=False):
     
     # Plot 4: Histogram/Distribution by level
     ax4 = axes[1, 1]
-    for level in ['EASY', 'MODERATE', 'HARD']:
-        data = df[df['level'] == level]['input_complexity']
-        if not data.empty:
-            ax4.hist(data, alpha=0.6, color=COLORS[level], label=level, bins=20)
-    
+    level_arrays = [df.loc[df['level'] == level, 'input_complexity'].to_numpy() for level in LEVELS]
+    # One hist call with shared bin edges instead of three separate binnings
+    ax4.hist(level_arrays, bins=np.histogram_bin_edges(np.concatenate(level_arrays), bins=20),
+             alpha=0.6, color=[_COLOR_RGBA[level] for level in LEVELS], label=LEVELS)
+
     ax4.set_xlabel('Input Complexity')
     ax4.set_ylabel('Frequency')
     ax4.set_title('Input Complexity Distribution by Difficulty Level')
     ax4.legend()
     ax4.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    
     if save_plot:
         os.makedirs(PLOTS_DIR, exist_ok=True)
         output_file = os.path.join(PLOTS_DIR, 'input_complexity_distribution.png')
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        fig.savefig(output_file, dpi=150, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 1})
         print(f"Input complexity distribution plot saved as {output_file}")
     
-    plt.show()
+    finish_figure(fig)
 
 
 def plot_input_code_length_distribution(df, save_plot=False):
     """Create comprehensive input code length distribution plot."""
     
     # Create figure with subplots
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12), constrained_layout=True)
     fig.suptitle('Input Code Length Distribution Analysis', fontsize=16, fontweight='bold')
     
-    violation_types = df['violation'].unique()
-    
+    violation_types = df['violation'].cat.categories
+    groups = group_arrays(df, 'input_code_length')
+
     # Plot 1: Scatter plot by violation type and level
     ax1 = axes[0, 0]
-    for i, violation in enumerate(violation_types):
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_code_length']
-            if not data.empty:
-                ax1.scatter([i] * len(data), data, alpha=0.6, color=COLORS[level], 
-                          label=level if i == 0 else "", s=40)
-    
+    scatter_groups(ax1, violation_types, groups, s=40, add_legend=True)
+
     ax1.set_xlabel('Violation Type')
     ax1.set_ylabel('Input Code Length')
     # ax1.set_title('Input Code Length by Violation Type and Level')
     ax1.set_xticks(range(len(violation_types)))
     ax1.set_xticklabels(violation_types)
-    ax1.legend()
     ax1.grid(True, alpha=0.3)
-    
+
     # Plot 2: Box plot with scatter overlay
     ax2 = axes[0, 1]
     length_data = []
     labels = []
+    levels = []
     positions = []
-    pos = 1
-    
+
     for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_code_length']
-            if not data.empty:
+        for level in LEVELS:
+            data = groups.get((violation, level))
+            if data is not None and len(data) > 0:
                 length_data.append(data)
                 labels.append(f'{violation}\n{level}')
-                positions.append(pos)
-                pos += 1
-    
+                levels.append(level)
+                positions.append(len(positions) + 1)
+
     # Create box plot
     bp = ax2.boxplot(length_data, positions=positions, patch_artist=True, widths=0.6)
-    
-    # Color the boxes and add scatter points
-    pos = 1
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_code_length']
-            if not data.empty:
-                # Color the box
-                if pos <= len(bp['boxes']):
-                    bp['boxes'][pos-1].set_facecolor(COLORS[level])
-                    bp['boxes'][pos-1].set_alpha(0.7)
-                
-                # Add scatter points with jitter
-                jitter = np.random.normal(0, 0.1, len(data))
-                ax2.scatter([pos] * len(data) + jitter, data, 
-                           alpha=0.6, color=COLORS[level], s=20, zorder=3)
-                pos += 1
-    
+
+    # Color the boxes, then overlay every group's points in one scatter call
+    for patch, level in zip(bp['boxes'], levels):
+        patch.set_facecolor(_COLOR_RGBA[level])
+        patch.set_alpha(0.7)
+    overlay_jittered_scatter(ax2, length_data, levels, s=20)
+
     ax2.set_title('Input Code Length Distribution (Box + Scatter)')
     ax2.set_ylabel('Input Code Length')
     ax2.set_xticks(positions)
@@ -699,8 +773,7 @@ def plot_input_code_length_distribution(df, save_plot=False):
     
     # Plot 3: Heatmap of average input code length
     ax3 = axes[1, 0]
-    pivot_input_length = df.groupby(['violation', 'level'])['input_code_length'].mean().reset_index()
-    pivot_input_length = pivot_input_length.pivot(index='violation', columns='level', values='input_code_length')
+    pivot_input_length = mean_matrix(df, 'input_code_length')
     
     sns.heatmap(pivot_input_length, annot=True, fmt='.0f', cmap='Blues', ax=ax3, 
                 cbar_kws={'label': 'Average Code Length'})
@@ -710,26 +783,25 @@ def plot_input_code_length_distribution(df, save_plot=False):
     
     # Plot 4: Histogram/Distribution by level
     ax4 = axes[1, 1]
-    for level in ['EASY', 'MODERATE', 'HARD']:
-        data = df[df['level'] == level]['input_code_length']
-        if not data.empty:
-            ax4.hist(data, alpha=0.6, color=COLORS[level], label=level, bins=20)
-    
+    level_arrays = [df.loc[df['level'] == level, 'input_code_length'].to_numpy() for level in LEVELS]
+    # One hist call with shared bin edges instead of three separate binnings
+    ax4.hist(level_arrays, bins=np.histogram_bin_edges(np.concatenate(level_arrays), bins=20),
+             alpha=0.6, color=[_COLOR_RGBA[level] for level in LEVELS], label=LEVELS)
+
     ax4.set_xlabel('Input Code Length')
     ax4.set_ylabel('Frequency')
     ax4.set_title('Input Code Length Distribution by Difficulty Level')
     ax4.legend()
     ax4.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    
     if save_plot:
         os.makedirs(PLOTS_DIR, exist_ok=True)
         output_file = os.path.join(PLOTS_DIR, 'input_code_length_distribution.png')
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        fig.savefig(output_file, dpi=150, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 1})
         print(f"Input code length distribution plot saved as {output_file}")
     
-    plt.show()
+    finish_figure(fig)
 
 
 def print_input_statistics(df):
@@ -739,21 +811,28 @@ def print_input_statistics(df):
     print("="*60)
     
     print(f"Total records: {len(df)}")
-    print(f"Violation types: {list(df['violation'].unique())}")
+    print(f"Violation types: {list(df['violation'].cat.categories)}")
     print(f"Difficulty levels: {list(df['level'].unique())}")
     
+    # All overall and grouped stats for both input columns in one agg each,
+    # sliced below for the individual print sections
+    input_cols = ['input_complexity', 'input_code_length']
+    overall = df[input_cols].agg(['mean', 'median', 'std', 'min', 'max'])
+    stats_by_level = df.groupby('level', observed=True)[input_cols].agg(['mean', 'median', 'std', 'min', 'max'])
+    stats_by_violation = df.groupby('violation', observed=True)[input_cols].agg(['mean', 'median', 'std', 'min', 'max'])
+
     # Input complexity statistics
     print("\n" + "="*60)
     print("INPUT COMPLEXITY STATISTICS")
     print("="*60)
-    print(f"Mean: {df['input_complexity'].mean():.2f}")
-    print(f"Median: {df['input_complexity'].median():.2f}")
-    print(f"Standard deviation: {df['input_complexity'].std():.2f}")
-    print(f"Min: {df['input_complexity'].min()}")
-    print(f"Max: {df['input_complexity'].max()}")
+    print(f"Mean: {overall.at['mean', 'input_complexity']:.2f}")
+    print(f"Median: {overall.at['median', 'input_complexity']:.2f}")
+    print(f"Standard deviation: {overall.at['std', 'input_complexity']:.2f}")
+    print(f"Min: {overall.at['min', 'input_complexity']}")
+    print(f"Max: {overall.at['max', 'input_complexity']}")
     
     # Find highest complexity case
-    max_complexity = df.loc[df['input_complexity'].idxmax()]
+    max_complexity = _row_at_argmax(df, 'input_complexity')
     print(f"\nHighest complexity case: {max_complexity['input_complexity']}")
     print(f"  - Violation: {max_complexity['violation']}")
     print(f"  - Level: {max_complexity['level']}")
@@ -761,26 +840,24 @@ def print_input_statistics(df):
     
     # Complexity by level
     print("\nComplexity by difficulty level:")
-    complexity_by_level = df.groupby('level')['input_complexity'].agg(['mean', 'median', 'std', 'min', 'max'])
-    print(complexity_by_level.round(2))
-    
+    print(stats_by_level['input_complexity'].round(2))
+
     # Complexity by violation type
     print("\nComplexity by violation type:")
-    complexity_by_violation = df.groupby('violation')['input_complexity'].agg(['mean', 'median', 'std', 'min', 'max'])
-    print(complexity_by_violation.round(2))
-    
+    print(stats_by_violation['input_complexity'].round(2))
+
     # Input code length statistics
     print("\n" + "="*60)
     print("INPUT CODE LENGTH STATISTICS")
     print("="*60)
-    print(f"Mean: {df['input_code_length'].mean():.2f}")
-    print(f"Median: {df['input_code_length'].median():.2f}")
-    print(f"Standard deviation: {df['input_code_length'].std():.2f}")
-    print(f"Min: {df['input_code_length'].min()}")
-    print(f"Max: {df['input_code_length'].max()}")
+    print(f"Mean: {overall.at['mean', 'input_code_length']:.2f}")
+    print(f"Median: {overall.at['median', 'input_code_length']:.2f}")
+    print(f"Standard deviation: {overall.at['std', 'input_code_length']:.2f}")
+    print(f"Min: {overall.at['min', 'input_code_length']}")
+    print(f"Max: {overall.at['max', 'input_code_length']}")
     
     # Find longest code case
-    max_length = df.loc[df['input_code_length'].idxmax()]
+    max_length = _row_at_argmax(df, 'input_code_length')
     print(f"\nLongest code case: {max_length['input_code_length']} characters")
     print(f"  - Violation: {max_length['violation']}")
     print(f"  - Level: {max_length['level']}")
@@ -788,13 +865,11 @@ def print_input_statistics(df):
     
     # Code length by level
     print("\nCode length by difficulty level:")
-    length_by_level = df.groupby('level')['input_code_length'].agg(['mean', 'median', 'std', 'min', 'max'])
-    print(length_by_level.round(2))
-    
+    print(stats_by_level['input_code_length'].round(2))
+
     # Code length by violation type
     print("\nCode length by violation type:")
-    length_by_violation = df.groupby('violation')['input_code_length'].agg(['mean', 'median', 'std', 'min', 'max'])
-    print(length_by_violation.round(2))
+    print(stats_by_violation['input_code_length'].round(2))
 
 
 def analyze_input_distributions(file_path=INPUT_FILE, save_plots=False):
@@ -856,13 +931,6 @@ if __name__ == "__main__":
 
 
 
-
-
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-import os
 
 
 """
@@ -871,171 +939,169 @@ Box Plot Distribution Analysis for SOLID Principles Dataset
 This script creates individual box plot visualizations for:
 1. Input complexity distribution (box plot with scatter overlay)
 2. Input code length distribution (box plot with scatter overlay)
-
-Required libraries: pandas, matplotlib, seaborn, numpy
-Input file: cyclomatic_complexity_results.csv
 """
 
-# Configuration
-INPUT_FILE = 'cyclomatic_complexity_results.csv'
-COLORS = {'EASY': '#2E8B57', 'MODERATE': '#FF8C00', 'HARD': '#DC143C'}
-PLOTS_DIR = 'plots'
-
-
-def load_data(file_path):
-    """Load and validate the CSV data."""
-    try:
-        df = pd.read_csv(file_path)
-        print(f"Successfully loaded {len(df)} records from {file_path}")
-        return df
-    except FileNotFoundError:
-        print(f"Error: File {file_path} not found!")
-        return None
-    except Exception as e:
-        print(f"Error loading data: {e}")
-        return None
 
-
-def plot_input_complexity_boxplot(df, save_plot=False):
+def plot_input_complexity_boxplot(df, save_plot=False, fig=None):
     """Create box plot with scatter overlay for input complexity distribution."""
+
+    # Create figure, or clear and reuse the caller's: clearing is much
+    # cheaper than allocating fresh buffers for every plot in a batch
+    owns_fig = fig is None
+    if owns_fig:
+        fig = plt.figure(figsize=(14, 8))
+    else:
+        fig = plt.figure(fig.number)  # make it current for the pyplot calls below
+        fig.clf()
     
-    # Create figure
-    plt.figure(figsize=(14, 8))
-    
-    violation_types = df['violation'].unique()
+    violation_types = df['violation'].cat.categories
     
-    # Prepare data for box plot
+    # Prepare data for box plot from one groupby pass
+    groups = group_arrays(df, 'input_complexity')
     complexity_data = []
-    labels = []
+    levels = []
     positions = []
-    pos = 1
-    
+    violation_blocks = []  # (violation, first position, last position)
+
     for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
+        block_start = len(positions) + 1
+        for level in LEVELS:
+            data = groups.get((violation, level))
+            if data is not None and len(data) > 0:
                 complexity_data.append(data)
-                labels.append(f'{violation} {level}')  # Single line format
-                positions.append(pos)
-                pos += 1
-    
-    # Create box plot
-    bp = plt.boxplot(complexity_data, positions=positions, patch_artist=True, widths=0.6)
-    
-    # Color the boxes and add scatter points
-    pos = 1
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
-                # Color the box
-                if pos <= len(bp['boxes']):
-                    bp['boxes'][pos-1].set_facecolor(COLORS[level])
-                    bp['boxes'][pos-1].set_alpha(0.7)
-                
-                # Add scatter points with jitter
-                jitter = np.random.normal(0, 0.1, len(data))
-                plt.scatter([pos] * len(data) + jitter, data, 
-                           alpha=0.6, color=COLORS[level], s=30, zorder=3)
-                pos += 1
+                levels.append(level)
+                positions.append(len(positions) + 1)
+        if len(positions) >= block_start:
+            violation_blocks.append((violation, block_start, len(positions)))
+    
+    # Create box plot from precomputed statistics; fliers duplicate the
+    # scatter overlay and tick management is done explicitly below
+    bp = plt.gca().bxp([box_stats(arr) for arr in complexity_data],
+                       positions=positions, patch_artist=True, widths=0.6,
+                       showfliers=False, manage_ticks=False)
+    
+    # Color the boxes
+    for patch, level in zip(bp['boxes'], levels):
+        patch.set_facecolor(_COLOR_RGBA[level])
+        patch.set_alpha(0.7)
+
+    # Overlay every group's jittered points with a single scatter artist
+    overlay_jittered_scatter(plt.gca(), complexity_data, levels, s=30)
     
     plt.title('Input Complexity Distribution (Box Plot with Scatter)', fontsize=14, fontweight='bold')
     plt.ylabel('Input Complexity', fontsize=12)
-    plt.xlabel('Violation Type and Difficulty Level', fontsize=12)
-    plt.xticks(positions, labels)
-    plt.setp(plt.gca().get_xticklabels(), rotation=45, ha='right')
+    plt.xlabel('Violation Type and Difficulty Level', fontsize=12, labelpad=28)
+    # Two-level ticks: short horizontal level names at each box and one
+    # centered violation label per block, instead of laying out rotated
+    # '<violation> <level>' strings at every position
+    plt.xticks(positions, levels, fontsize=9)
+    for violation, first, last in violation_blocks:
+        plt.gca().text((first + last) / 2, -0.06, violation, ha='center', va='top',
+                       fontweight='bold', transform=plt.gca().get_xaxis_transform())
     
     # Remove top and right spines
     ax = plt.gca()
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
+    # Flatten the jittered overlays (zorder 3) into one raster layer on
+    # vector export while keeping axes, labels and legend as vectors
+    ax.set_rasterization_zorder(3.5)
     
-    # Add legend
-    legend_elements = [plt.Line2D([0], [0], marker='o', color='w', 
-                                 markerfacecolor=COLORS[level], markersize=8, label=level)
-                      for level in ['EASY', 'MODERATE', 'HARD']]
-    plt.legend(handles=legend_elements, title='Difficulty Level', loc='upper right')
+    # Add legend (handles shared at module scope)
+    plt.legend(handles=_LEGEND_HANDLES, title='Difficulty Level', loc='upper right')
     
     plt.tight_layout()
     
     if save_plot:
         os.makedirs(PLOTS_DIR, exist_ok=True)
         output_file = os.path.join(PLOTS_DIR, 'input_complexity_boxplot.png')
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        fig.savefig(output_file, dpi=150, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 1})
         print(f"Input complexity box plot saved as {output_file}")
-    
-    plt.show()
+
+    if owns_fig:
+        finish_figure(fig)
 
 
-def plot_input_code_length_boxplot(df, save_plot=False):
+def plot_input_code_length_boxplot(df, save_plot=False, fig=None):
     """Create box plot with scatter overlay for input code length distribution."""
+
+    # Create figure, or clear and reuse the caller's: clearing is much
+    # cheaper than allocating fresh buffers for every plot in a batch
+    owns_fig = fig is None
+    if owns_fig:
+        fig = plt.figure(figsize=(14, 8))
+    else:
+        fig = plt.figure(fig.number)  # make it current for the pyplot calls below
+        fig.clf()
     
-    # Create figure
-    plt.figure(figsize=(14, 8))
-    
-    violation_types = df['violation'].unique()
+    violation_types = df['violation'].cat.categories
     
-    # Prepare data for box plot
+    # Prepare data for box plot from one groupby pass
+    groups = group_arrays(df, 'input_code_length')
     length_data = []
-    labels = []
+    levels = []
     positions = []
-    pos = 1
-    
+    violation_blocks = []  # (violation, first position, last position)
+
     for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_code_length']
-            if not data.empty:
+        block_start = len(positions) + 1
+        for level in LEVELS:
+            data = groups.get((violation, level))
+            if data is not None and len(data) > 0:
                 length_data.append(data)
-                labels.append(f'{violation}\n{level}')
-                positions.append(pos)
-                pos += 1
-    
-    # Create box plot
-    bp = plt.boxplot(length_data, positions=positions, patch_artist=True, widths=0.6)
-    
-    # Color the boxes and add scatter points
-    pos = 1
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_code_length']
-            if not data.empty:
-                # Color the box
-                if pos <= len(bp['boxes']):
-                    bp['boxes'][pos-1].set_facecolor(COLORS[level])
-                    bp['boxes'][pos-1].set_alpha(0.7)
-                
-                # Add scatter points with jitter
-                jitter = np.random.normal(0, 0.1, len(data))
-                plt.scatter([pos] * len(data) + jitter, data, 
-                           alpha=0.6, color=COLORS[level], s=30, zorder=3)
-                pos += 1
+                levels.append(level)
+                positions.append(len(positions) + 1)
+        if len(positions) >= block_start:
+            violation_blocks.append((violation, block_start, len(positions)))
+    
+    # Create box plot from precomputed statistics; fliers duplicate the
+    # scatter overlay and tick management is done explicitly below
+    bp = plt.gca().bxp([box_stats(arr) for arr in length_data],
+                       positions=positions, patch_artist=True, widths=0.6,
+                       showfliers=False, manage_ticks=False)
+    
+    # Color the boxes
+    for patch, level in zip(bp['boxes'], levels):
+        patch.set_facecolor(_COLOR_RGBA[level])
+        patch.set_alpha(0.7)
+
+    # Overlay every group's jittered points with a single scatter artist
+    overlay_jittered_scatter(plt.gca(), length_data, levels, s=30)
     
     plt.title('Input Code Length Distribution (Box Plot with Scatter)', fontsize=14, fontweight='bold')
     plt.ylabel('Input Code Length', fontsize=12)
-    plt.xlabel('Violation Type and Difficulty Level', fontsize=12)
-    plt.xticks(positions, labels)
-    plt.setp(plt.gca().get_xticklabels(), rotation=45, ha='right')
+    plt.xlabel('Violation Type and Difficulty Level', fontsize=12, labelpad=28)
+    # Two-level ticks: short horizontal level names at each box and one
+    # centered violation label per block, instead of laying out rotated
+    # '<violation>\n<level>' strings at every position
+    plt.xticks(positions, levels, fontsize=9)
+    for violation, first, last in violation_blocks:
+        plt.gca().text((first + last) / 2, -0.06, violation, ha='center', va='top',
+                       fontweight='bold', transform=plt.gca().get_xaxis_transform())
     
     # Remove top and right spines
     ax = plt.gca()
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
+    # Flatten the jittered overlays (zorder 3) into one raster layer on
+    # vector export while keeping axes, labels and legend as vectors
+    ax.set_rasterization_zorder(3.5)
     
-    # Add legend
-    legend_elements = [plt.Line2D([0], [0], marker='o', color='w', 
-                                 markerfacecolor=COLORS[level], markersize=8, label=level)
-                      for level in ['EASY', 'MODERATE', 'HARD']]
-    plt.legend(handles=legend_elements, title='Difficulty Level', loc='upper right')
+    # Add legend (handles shared at module scope)
+    plt.legend(handles=_LEGEND_HANDLES, title='Difficulty Level', loc='upper right')
     
     plt.tight_layout()
     
     if save_plot:
         os.makedirs(PLOTS_DIR, exist_ok=True)
         output_file = os.path.join(PLOTS_DIR, 'input_code_length_boxplot.png')
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        fig.savefig(output_file, dpi=150, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 1})
         print(f"Input code length box plot saved as {output_file}")
-    
-    plt.show()
+
+    if owns_fig:
+        finish_figure(fig)
 
 
 def print_boxplot_statistics(df):
@@ -1045,40 +1111,45 @@ def print_boxplot_statistics(df):
     print("="*60)
     
     print(f"Total records: {len(df)}")
-    print(f"Violation types: {list(df['violation'].unique())}")
+    print(f"Violation types: {list(df['violation'].cat.categories)}")
     print(f"Difficulty levels: {list(df['level'].unique())}")
-    
+
+    # Quartiles straight from the raw arrays: one index dict, one take and
+    # one np.quantile (a single partial sort for all three cut points) per
+    # group, with no pandas quantile machinery in between
+    idx = df.groupby(['violation', 'level'], sort=False, observed=True).indices
+    vals_c = df['input_complexity'].to_numpy()
+    vals_l = df['input_code_length'].to_numpy()
+
     # Input complexity quartile statistics
     print("\n" + "="*60)
     print("INPUT COMPLEXITY - QUARTILE STATISTICS BY GROUP")
     print("="*60)
     
-    for violation in df['violation'].unique():
+    for violation in df['violation'].cat.categories:
         print(f"\n{violation}:")
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
-                q1 = data.quantile(0.25)
-                median = data.median()
-                q3 = data.quantile(0.75)
+        for level in LEVELS:
+            ind = idx.get((violation, level))
+            if ind is not None and len(ind) > 0:
+                arr = vals_c.take(ind)
+                q1, median, q3 = np.quantile(arr, [0.25, 0.5, 0.75])
                 iqr = q3 - q1
-                print(f"  {level:8}: Q1={q1:5.1f}, Median={median:5.1f}, Q3={q3:5.1f}, IQR={iqr:5.1f}, n={len(data)}")
+                print(f"  {level:8}: Q1={q1:5.1f}, Median={median:5.1f}, Q3={q3:5.1f}, IQR={iqr:5.1f}, n={arr.size}")
     
     # Input code length quartile statistics
     print("\n" + "="*60)
     print("INPUT CODE LENGTH - QUARTILE STATISTICS BY GROUP")
     print("="*60)
     
-    for violation in df['violation'].unique():
+    for violation in df['violation'].cat.categories:
         print(f"\n{violation}:")
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_code_length']
-            if not data.empty:
-                q1 = data.quantile(0.25)
-                median = data.median()
-                q3 = data.quantile(0.75)
+        for level in LEVELS:
+            ind = idx.get((violation, level))
+            if ind is not None and len(ind) > 0:
+                arr = vals_l.take(ind)
+                q1, median, q3 = np.quantile(arr, [0.25, 0.5, 0.75])
                 iqr = q3 - q1
-                print(f"  {level:8}: Q1={q1:6.0f}, Median={median:6.0f}, Q3={q3:6.0f}, IQR={iqr:6.0f}, n={len(data)}")
+                print(f"  {level:8}: Q1={q1:6.0f}, Median={median:6.0f}, Q3={q3:6.0f}, IQR={iqr:6.0f}, n={arr.size}")
 
 
 def plot_combined_input_boxplots(df, save_plot=False):
@@ -1087,100 +1158,56 @@ def plot_combined_input_boxplots(df, save_plot=False):
     # Create figure with subplots
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 12))
     
-    violation_types = df['violation'].unique()
-    
+    violation_types = df['violation'].cat.categories
+
+    # Both panels share the same rows, so group keys, levels and x positions
+    # are computed once and reused; only the value arrays differ per panel
+    groups_c = group_arrays(df, 'input_complexity')
+    groups_l = group_arrays(df, 'input_code_length')
+    keys = [(violation, level)
+            for violation in violation_types
+            for level in LEVELS
+            if len(groups_c.get((violation, level), ())) > 0]
+    levels = [level for _, level in keys]
+    positions = list(range(1, len(keys) + 1))
+
+    def _panel(ax, groups):
+        data_list = [groups[key] for key in keys]
+        bp = ax.bxp([box_stats(arr) for arr in data_list],
+                    positions=positions, patch_artist=True, widths=0.6,
+                    showfliers=False, manage_ticks=False)
+        # Color the boxes, then overlay every group's points in one scatter call
+        for patch, level in zip(bp['boxes'], levels):
+            patch.set_facecolor(_COLOR_RGBA[level])
+            patch.set_alpha(0.7)
+        overlay_jittered_scatter(ax, data_list, levels, s=30)
+        ax.set_xticks(positions)
+        # Remove top and right spines
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.set_rasterization_zorder(3.5)
+
     # Plot 1: Input Complexity
-    complexity_data = []
-    labels = []
-    positions = []
-    pos = 1
-    
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
-                complexity_data.append(data)
-                labels.append(f'{violation}\n{level}')
-                positions.append(pos)
-                pos += 1
-    
-    # Create box plot for complexity
-    bp1 = ax1.boxplot(complexity_data, positions=positions, patch_artist=True, widths=0.6)
-    
-    # Color the boxes and add scatter points for complexity
-    pos = 1
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_complexity']
-            if not data.empty:
-                # Color the box
-                if pos <= len(bp1['boxes']):
-                    bp1['boxes'][pos-1].set_facecolor(COLORS[level])
-                    bp1['boxes'][pos-1].set_alpha(0.7)
-                
-                # Add scatter points with jitter
-                jitter = np.random.normal(0, 0.1, len(data))
-                ax1.scatter([pos] * len(data) + jitter, data, 
-                           alpha=0.6, color=COLORS[level], s=30, zorder=3)
-                pos += 1
-    
+    _panel(ax1, groups_c)
     ax1.set_ylabel('Input Complexity', fontsize=20)
-    ax1.set_xticks(positions)
     ax1.set_xticklabels([])  # Remove x-axis labels for upper plot
-    
-    # Remove top and right spines for complexity plot
-    ax1.spines['top'].set_visible(False)
-    ax1.spines['right'].set_visible(False)
-    
+
     # Plot 2: Input Code Length
-    length_data = []
-    length_labels = []
-    length_positions = []
-    pos = 1
-    
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_code_length']
-            if not data.empty:
-                length_data.append(data)
-                length_labels.append(f'{violation} {level}')  # Single line format
-                length_positions.append(pos)
-                pos += 1
-    
-    # Create box plot for code length
-    bp2 = ax2.boxplot(length_data, positions=length_positions, patch_artist=True, widths=0.6)
-    
-    # Color the boxes and add scatter points for code length
-    pos = 1
-    for violation in violation_types:
-        for level in ['EASY', 'MODERATE', 'HARD']:
-            data = df[(df['violation'] == violation) & (df['level'] == level)]['input_code_length']
-            if not data.empty:
-                # Color the box
-                if pos <= len(bp2['boxes']):
-                    bp2['boxes'][pos-1].set_facecolor(COLORS[level])
-                    bp2['boxes'][pos-1].set_alpha(0.7)
-                
-                # Add scatter points with jitter
-                jitter = np.random.normal(0, 0.1, len(data))
-                ax2.scatter([pos] * len(data) + jitter, data, 
-                           alpha=0.6, color=COLORS[level], s=30, zorder=3)
-                pos += 1
-    
+    _panel(ax2, groups_l)
     ax2.set_ylabel('Input Code Length', fontsize=20)
-    ax2.set_xticks(length_positions)
-    ax2.set_xticklabels(length_labels)
-    plt.setp(ax2.get_xticklabels(), rotation=45, ha='right', fontsize=18)
-    
-    # Remove top and right spines for code length plot
-    ax2.spines['top'].set_visible(False)
-    ax2.spines['right'].set_visible(False)
-    
-    # Add legend to the first subplot
-    legend_elements = [plt.Line2D([0], [0], marker='o', color='w', 
-                                 markerfacecolor=COLORS[level], markersize=12, label=level)
-                      for level in ['EASY', 'MODERATE', 'HARD']]
-    ax1.legend(handles=legend_elements, title='Difficulty Level', loc='upper right', 
+    # Two-level ticks: horizontal level names at each box plus one centered
+    # violation label per block, instead of rotated combined strings
+    ax2.set_xticklabels([level for _, level in keys], fontsize=14)
+    blocks = {}
+    for pos, (violation, _) in zip(positions, keys):
+        blocks.setdefault(violation, []).append(pos)
+    for violation, block in blocks.items():
+        ax2.text((block[0] + block[-1]) / 2, -0.07, violation, ha='center', va='top',
+                 fontsize=16, fontweight='bold', transform=ax2.get_xaxis_transform())
+
+
+    # Add legend to the first subplot (handles shared at module scope)
+    ax1.legend(handles=_LEGEND_HANDLES_LARGE, title='Difficulty Level', loc='upper right', 
                fontsize=16, title_fontsize=18)
     
     plt.tight_layout()
@@ -1188,10 +1215,11 @@ def plot_combined_input_boxplots(df, save_plot=False):
     if save_plot:
         os.makedirs(PLOTS_DIR, exist_ok=True)
         output_file = os.path.join(PLOTS_DIR, 'combined_input_boxplots.png')
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        fig.savefig(output_file, dpi=150, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 1})
         print(f"Combined input box plots saved as {output_file}")
     
-    plt.show()
+    finish_figure(fig)
 
 
 def analyze_input_boxplots(file_path=INPUT_FILE, save_plots=False):
@@ -1204,9 +1232,12 @@ def analyze_input_boxplots(file_path=INPUT_FILE, save_plots=False):
     # Create combined box plots
     plot_combined_input_boxplots(df, save_plots)
     
-    # Create individual box plots (optional)
-    # plot_input_complexity_boxplot(df, save_plots)
-    # plot_input_code_length_boxplot(df, save_plots)
+    # Create individual box plots (optional); both renders share one
+    # figure via the fig kwarg instead of allocating a new one each
+    # fig = plt.figure(figsize=(14, 8))
+    # plot_input_complexity_boxplot(df, save_plots, fig=fig)
+    # plot_input_code_length_boxplot(df, save_plots, fig=fig)
+    # finish_figure(fig)
     
     # Print box plot specific statistics
     print_boxplot_statistics(df)